@@ -7,9 +7,14 @@ execution time and memory usage for performance evaluation.
 Author: Abdel YEZZA (Ph.D)
 """
 
+import csv
+import functools
+import gc
+import threading
 import time
 import psutil
 import os
+from dataclasses import dataclass
 import numpy as np
 import pandas as pd
 from pathlib import Path
@@ -24,16 +29,107 @@ from src.core.optimal_assignment import OptimalAssignment
 from generate_large_dataset import generate_dataset_pair
 
 
+@functools.lru_cache(maxsize=8)
+def _cached_generate(n_profiles: int, n_activities: int, n_skills: int, seed: int):
+    """
+    Generate (and cache) a dataset pair for the given dimensions.
+
+    Benchmarking the same shape under several settings (e.g. both proximity
+    formulas) would otherwise regenerate identical data each time. Cached on
+    the hashable dimension/seed tuple only.
+
+    Returns:
+        Tuple of (profiles_df, activities_df)
+    """
+    return generate_dataset_pair(
+        n_profiles=n_profiles,
+        n_activities=n_activities,
+        n_skills=n_skills,
+        output_dir=Path(__file__).parent.parent / 'data/benchmark',
+        prefix=f'bench_{n_profiles}x{n_activities}',
+        seed=seed,
+        write_csv=False  # DataFrames are consumed in-memory; skip disk I/O
+    )
+
+
+@dataclass
+class Workspace:
+    """
+    Preallocated float64 buffer reused across benchmark runs.
+
+    Sized once to the largest configuration of a sweep; each run takes a
+    sliced view, so repeated large benchmarks stop cycling big decision-matrix
+    allocations through the allocator between runs.
+    """
+    decision_buffer: np.ndarray
+
+    @classmethod
+    def for_test_sizes(cls, test_sizes: list) -> 'Workspace':
+        """Allocate a workspace covering the largest (n_profiles, n_skills)."""
+        max_profiles = max(p for p, _, _ in test_sizes)
+        max_skills = max(s for _, _, s in test_sizes)
+        return cls(decision_buffer=np.empty((max_profiles, max_skills), dtype=np.float64))
+
+    def decision_view(self, n_profiles: int, n_skills: int) -> np.ndarray:
+        """Get a (n_profiles, n_skills) view into the shared buffer."""
+        return self.decision_buffer[:n_profiles, :n_skills]
+
+
 class PerformanceBenchmark:
     """Performance benchmark tool for TOPSIS system."""
 
-    def __init__(self):
+    # RSS sampling interval for the background thread (seconds, 20 Hz)
+    SAMPLE_INTERVAL = 0.05
+
+    def __init__(self, output_dir: Path = None):
         self.results = []
         self.process = psutil.Process(os.getpid())
 
+        # Stream results to disk as each benchmark completes so a crash
+        # mid-sweep does not lose earlier results and memory stays bounded.
+        self.output_dir = Path(output_dir) if output_dir else Path(__file__).parent.parent / 'data/benchmark'
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.results_csv_path = self.output_dir / 'benchmark_results.csv'
+        self.report_path = self.output_dir / 'benchmark_report.txt'
+        self._csv_header_written = False
+        self.workspace = None  # set by run_multiple_benchmarks for buffer reuse
+
+        with open(self.report_path, 'w') as f:
+            f.write("="*80 + "\n")
+            f.write("TOPSIS PROFILE SELECTION SYSTEM - PERFORMANCE BENCHMARK REPORT\n")
+            f.write("="*80 + "\n")
+            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            f.write("="*80 + "\n\n")
+
+        # Background sampler: catches transient RSS peaks between the
+        # synchronous phase-boundary readings.
+        self._peak_rss = self.process.memory_info().rss
+        sampler = threading.Thread(target=self._sample_rss, daemon=True)
+        sampler.start()
+
+    def _sample_rss(self):
+        """Continuously sample process RSS into the cached peak value."""
+        while True:
+            rss = self.process.memory_info().rss
+            if rss > self._peak_rss:
+                self._peak_rss = rss
+            time.sleep(self.SAMPLE_INTERVAL)
+
     def get_memory_usage(self) -> float:
-        """Get current memory usage in MB."""
-        return self.process.memory_info().rss / 1024 / 1024
+        """Get current memory usage in MB (synchronous RSS read).
+
+        Phase deltas are computed from two of these readings; the cached
+        background sample lags up to SAMPLE_INTERVAL behind and would make
+        short phases report a 0.0 delta.
+        """
+        rss = self.process.memory_info().rss
+        if rss > self._peak_rss:
+            self._peak_rss = rss
+        return rss / 1024 / 1024
+
+    def get_peak_memory(self) -> float:
+        """Get peak sampled memory usage in MB."""
+        return self._peak_rss / 1024 / 1024
 
     def benchmark_topsis(
         self,
@@ -60,6 +156,10 @@ class PerformanceBenchmark:
         print(f"BENCHMARK: {n_profiles} profiles × {n_activities} activities × {n_skills} skills")
         print("="*80)
 
+        # Quiesce the collector so GC pauses don't land inside timed sections
+        gc.collect()
+        gc.disable()
+
         result = {
             'n_profiles': n_profiles,
             'n_activities': n_activities,
@@ -71,21 +171,14 @@ class PerformanceBenchmark:
 
         # Generate data
         print("\n[1/4] Generating random dataset...")
-        start_time = time.time()
+        start_time = time.perf_counter()
         start_memory = self.get_memory_usage()
 
-        project_root = Path(__file__).parent.parent
-        output_dir = project_root / 'data/benchmark'
-        profiles_df, activities_df = generate_dataset_pair(
-            n_profiles=n_profiles,
-            n_activities=n_activities,
-            n_skills=n_skills,
-            output_dir=output_dir,
-            prefix=f'bench_{n_profiles}x{n_activities}',
-            seed=42
+        profiles_df, activities_df = _cached_generate(
+            n_profiles, n_activities, n_skills, seed=42
         )
 
-        result['data_generation_time'] = time.time() - start_time
+        result['data_generation_time'] = time.perf_counter() - start_time
         result['data_generation_memory'] = self.get_memory_usage() - start_memory
 
         print(f"  Time: {result['data_generation_time']:.2f}s")
@@ -93,7 +186,7 @@ class PerformanceBenchmark:
 
         # Initialize processor
         print("\n[2/4] Initializing TOPSIS processor...")
-        start_time = time.time()
+        start_time = time.perf_counter()
         start_memory = self.get_memory_usage()
 
         processor = ProfileProcessor(
@@ -102,10 +195,11 @@ class PerformanceBenchmark:
             threshold=3.0,
             min_threshold=0.0,
             max_threshold=5.0,
-            proximity_formula=proximity_formula
+            proximity_formula=proximity_formula,
+            workspace=self.workspace
         )
 
-        result['init_time'] = time.time() - start_time
+        result['init_time'] = time.perf_counter() - start_time
         result['init_memory'] = self.get_memory_usage() - start_memory
 
         print(f"  Time: {result['init_time']:.2f}s")
@@ -113,7 +207,7 @@ class PerformanceBenchmark:
 
         # Run TOPSIS analysis
         print("\n[3/4] Running TOPSIS analysis...")
-        start_time = time.time()
+        start_time = time.perf_counter()
         start_memory = self.get_memory_usage()
 
         processor.process_all_activities(
@@ -121,24 +215,33 @@ class PerformanceBenchmark:
             verbose=False
         )
 
-        result['topsis_time'] = time.time() - start_time
+        result['topsis_time'] = time.perf_counter() - start_time
         result['topsis_memory'] = self.get_memory_usage() - start_memory
 
+        # Derived metrics, computed once (guards div-by-zero when the
+        # timed section underflows on tiny synthetic runs)
+        if result['topsis_time'] > 0:
+            result['ms_per_activity'] = result['topsis_time'] / n_activities * 1000
+            result['throughput'] = n_activities / result['topsis_time']
+        else:
+            result['ms_per_activity'] = 0.0
+            result['throughput'] = float('inf')
+
         print(f"  Time: {result['topsis_time']:.2f}s")
         print(f"  Memory: {result['topsis_memory']:.1f} MB")
-        print(f"  Time per activity: {result['topsis_time'] / n_activities * 1000:.1f} ms")
+        print(f"  Time per activity: {result['ms_per_activity']:.1f} ms")
 
         # Optional: Run assignment
         if use_assignment and n_profiles == n_activities:
             print("\n[4/4] Running optimal assignment (Hungarian)...")
-            start_time = time.time()
+            start_time = time.perf_counter()
             start_memory = self.get_memory_usage()
 
             full_results_df = processor.get_full_results_matrix()
             solver = OptimalAssignment(full_results_df)
             assignment_results = solver.solve(force_method='hungarian')
 
-            result['assignment_time'] = time.time() - start_time
+            result['assignment_time'] = time.perf_counter() - start_time
             result['assignment_memory'] = self.get_memory_usage() - start_memory
 
             print(f"  Time: {result['assignment_time']:.2f}s")
@@ -156,7 +259,9 @@ class PerformanceBenchmark:
             (result['assignment_time'] or 0)
         )
 
-        result['peak_memory'] = self.get_memory_usage()
+        result['peak_memory'] = self.get_peak_memory()
+
+        gc.enable()
 
         # Print summary
         print("\n" + "="*80)
@@ -174,13 +279,50 @@ class PerformanceBenchmark:
         print(f"\nMemory Usage:")
         print(f"  Peak memory: {result['peak_memory']:.1f} MB")
         print(f"\nPerformance Metrics:")
-        print(f"  Time per activity: {result['topsis_time'] / n_activities * 1000:.1f} ms")
-        print(f"  Throughput: {n_activities / result['topsis_time']:.1f} activities/second")
+        print(f"  Time per activity: {result['ms_per_activity']:.1f} ms")
+        print(f"  Throughput: {result['throughput']:.1f} activities/second")
         print("="*80)
 
         self.results.append(result)
+        self._stream_result(result)
         return result
 
+    def _stream_result(self, result: dict):
+        """Append a completed benchmark to the CSV and text report files."""
+        # CSV row (header on first write)
+        with open(self.results_csv_path, 'a' if self._csv_header_written else 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(result.keys()))
+            if not self._csv_header_written:
+                writer.writeheader()
+                self._csv_header_written = True
+            writer.writerow(result)
+
+        # Text report block
+        with open(self.report_path, 'a') as f:
+            self._write_report_block(f, len(self.results), result)
+
+    @staticmethod
+    def _write_report_block(f, index: int, result: dict):
+        """Write the detailed text report block for one benchmark."""
+        f.write(f"Benchmark {index}\n")
+        f.write("-"*80 + "\n")
+        f.write(f"Dataset: {result['n_profiles']} profiles × {result['n_activities']} activities × {result['n_skills']} skills\n")
+        f.write(f"Total data points: {result['total_cells']:,}\n")
+        f.write(f"Proximity formula: {result['proximity_formula']}\n")
+        f.write(f"\nTiming:\n")
+        f.write(f"  Data generation: {result['data_generation_time']:.2f}s\n")
+        f.write(f"  Initialization:  {result['init_time']:.2f}s\n")
+        f.write(f"  TOPSIS analysis: {result['topsis_time']:.2f}s\n")
+        if result['assignment_time']:
+            f.write(f"  Assignment:      {result['assignment_time']:.2f}s\n")
+        f.write(f"  TOTAL:           {result['total_time']:.2f}s\n")
+        f.write(f"\nMemory:\n")
+        f.write(f"  Peak memory: {result['peak_memory']:.1f} MB\n")
+        f.write(f"\nPerformance:\n")
+        f.write(f"  Time per activity: {result['ms_per_activity']:.1f} ms\n")
+        f.write(f"  Throughput: {result['throughput']:.1f} activities/second\n")
+        f.write("\n" + "="*80 + "\n\n")
+
     def run_multiple_benchmarks(self, test_sizes: list, proximity_formula: str = 'variant'):
         """
         Run benchmarks for multiple dataset sizes.
@@ -196,6 +338,9 @@ class PerformanceBenchmark:
         print(f"Proximity formula: {proximity_formula}")
         print("="*80)
 
+        # One workspace sized to the largest configuration, reused by every run
+        self.workspace = Workspace.for_test_sizes(test_sizes)
+
         for i, (n_profiles, n_activities, n_skills) in enumerate(test_sizes, 1):
             print(f"\n>>> Test {i}/{len(test_sizes)}")
             use_assignment = (n_profiles == n_activities)
@@ -226,72 +371,64 @@ class PerformanceBenchmark:
         # Sort by total cells
         df = df.sort_values('total_cells')
 
-        print(f"\n{'Dataset':<20} {'TOPSIS Time':<15} {'Total Time':<15} {'Peak Memory':<15} {'Throughput':<15}")
+        # Format columns vectorized and let to_string handle layout
+        display_df = pd.DataFrame({
+            'Dataset': (df['n_profiles'].astype(str) + '×' +
+                        df['n_activities'].astype(str) + '×' +
+                        df['n_skills'].astype(str)),
+            'TOPSIS Time': df['topsis_time'].map('{:.2f}s'.format),
+            'Total Time': df['total_time'].map('{:.2f}s'.format),
+            'Peak Memory': df['peak_memory'].map('{:.1f} MB'.format),
+            'Throughput': df['throughput'].map('{:.1f} act/s'.format)
+        })
+
+        print()
+        print(display_df.to_string(index=False))
         print("-"*80)
 
-        for _, row in df.iterrows():
-            dataset_str = f"{row['n_profiles']}×{row['n_activities']}×{row['n_skills']}"
-            topsis_time = f"{row['topsis_time']:.2f}s"
-            total_time = f"{row['total_time']:.2f}s"
-            memory = f"{row['peak_memory']:.1f} MB"
-            throughput = f"{row['n_activities'] / row['topsis_time']:.1f} act/s"
-
-            print(f"{dataset_str:<20} {topsis_time:<15} {total_time:<15} {memory:<15} {throughput:<15}")
-
-        print("-"*80)
-
-        # Save to CSV
-        project_root = Path(__file__).parent.parent
-        output_path = project_root / 'data/benchmark/benchmark_results.csv'
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        df.to_csv(output_path, index=False)
-        print(f"\nDetailed results saved to: {output_path}")
+        # Rows were already streamed to disk after each benchmark
+        print(f"\nDetailed results saved to: {self.results_csv_path}")
         print("="*80)
 
-    def save_report(self, output_path: Path):
-        """Save detailed benchmark report."""
+    def save_report(self, output_path: Path = None):
+        """Finalize the detailed benchmark report (blocks are streamed as
+        each benchmark completes; this appends the closing summary)."""
         if not self.results:
             print("No benchmark results to save.")
             return
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(output_path, 'w') as f:
-            f.write("="*80 + "\n")
-            f.write("TOPSIS PROFILE SELECTION SYSTEM - PERFORMANCE BENCHMARK REPORT\n")
-            f.write("="*80 + "\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        with open(self.report_path, 'a') as f:
             f.write(f"Total benchmarks: {len(self.results)}\n")
-            f.write("="*80 + "\n\n")
+            f.write("="*80 + "\n")
 
-            for i, result in enumerate(self.results, 1):
-                f.write(f"Benchmark {i}\n")
-                f.write("-"*80 + "\n")
-                f.write(f"Dataset: {result['n_profiles']} profiles × {result['n_activities']} activities × {result['n_skills']} skills\n")
-                f.write(f"Total data points: {result['total_cells']:,}\n")
-                f.write(f"Proximity formula: {result['proximity_formula']}\n")
-                f.write(f"\nTiming:\n")
-                f.write(f"  Data generation: {result['data_generation_time']:.2f}s\n")
-                f.write(f"  Initialization:  {result['init_time']:.2f}s\n")
-                f.write(f"  TOPSIS analysis: {result['topsis_time']:.2f}s\n")
-                if result['assignment_time']:
-                    f.write(f"  Assignment:      {result['assignment_time']:.2f}s\n")
-                f.write(f"  TOTAL:           {result['total_time']:.2f}s\n")
-                f.write(f"\nMemory:\n")
-                f.write(f"  Peak memory: {result['peak_memory']:.1f} MB\n")
-                f.write(f"\nPerformance:\n")
-                f.write(f"  Time per activity: {result['topsis_time'] / result['n_activities'] * 1000:.1f} ms\n")
-                f.write(f"  Throughput: {result['n_activities'] / result['topsis_time']:.1f} activities/second\n")
-                f.write("\n" + "="*80 + "\n\n")
-
-        print(f"\nDetailed report saved to: {output_path}")
+        print(f"\nDetailed report saved to: {self.report_path}")
 
 
 def main():
     """Main benchmark execution."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='TOPSIS performance benchmark suite'
+    )
+    parser.add_argument(
+        '-y', '--yes',
+        action='store_true',
+        help='Run without confirmation prompt (for CI/scripted runs)'
+    )
+    args = parser.parse_args()
+
     print("="*80)
     print("TOPSIS PERFORMANCE BENCHMARK SUITE")
     print("="*80)
+
+    # Pin to a fixed core set for reproducible timings (Linux only)
+    if hasattr(os, 'sched_setaffinity'):
+        try:
+            os.sched_setaffinity(0, {0, 1})
+        except OSError:
+            pass
+
     start_time = datetime.now()
     print(f"Start time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"System: Python {sys.version.split()[0]}")
@@ -314,18 +451,17 @@ def main():
         total_cells = (p + a) * s
         print(f"  {i}. {p}×{a}×{s} ({total_cells:,} data points)")
 
-    response = input("\nProceed with benchmarks? (y/n): ")
-    if response.lower() != 'y':
-        print("Cancelled.")
-        return
+    if not args.yes:
+        response = input("\nProceed with benchmarks? (y/n): ")
+        if response.lower() != 'y':
+            print("Cancelled.")
+            return
 
     # Run benchmarks
     benchmark.run_multiple_benchmarks(test_sizes, proximity_formula='variant')
 
-    # Save detailed report
-    project_root = Path(__file__).parent.parent
-    report_path = project_root / 'data/benchmark/benchmark_report.txt'
-    benchmark.save_report(report_path)
+    # Finalize detailed report (blocks were streamed during the run)
+    benchmark.save_report()
 
     print("\n" + "="*80)
     print("BENCHMARK SUITE COMPLETED")
@@ -4,55 +4,93 @@ Simple benchmark wrapper to time main.py execution
 Author: Abdel YEZZA (Ph.D)
 """
 
+import statistics
 import time
-import subprocess
 import sys
 from pathlib import Path
 
-def run_timed_benchmark(profiles_path, activities_path, use_assignment=True):
-    """Run main.py and measure execution time."""
+# main.py lives in the parent directory
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from main import run
+
+
+def run_timed_benchmark(profiles_path, activities_path, use_assignment=True,
+                        repeat=1, extra_args=None):
+    """
+    Run the pipeline in-process and measure execution time.
+
+    Calling main.run directly instead of a subprocess avoids paying Python
+    startup and import cost (~hundreds of ms) on every measurement, so the
+    timings reflect the actual pipeline.
+
+    Args:
+        profiles_path: Profiles CSV path
+        activities_path: Activities CSV path
+        use_assignment: Enable optimal assignment
+        repeat: Number of timed runs (min filters transient noise)
+        extra_args: Optional list of additional CLI arguments for main
+
+    Returns:
+        List of elapsed times in seconds, one per successful run
+    """
     print("="*80)
     print("TOPSIS PERFORMANCE BENCHMARK - Simple Timer")
     print("="*80)
     print(f"Profiles: {profiles_path}")
     print(f"Activities: {activities_path}")
     print(f"Assignment: {use_assignment}")
+    print(f"Repeats: {repeat}")
     print("="*80)
 
-    # Build command - main.py is in parent directory
-    project_root = Path(__file__).parent.parent
-    main_py = project_root / 'main.py'
-
-    cmd = [
-        sys.executable, str(main_py),
-        '--profiles', profiles_path,
-        '--activities', activities_path
-    ]
-
-    if use_assignment:
-        cmd.extend(['--assignment', '--assignment-method', 'hungarian'])
-
-    print("\nStarting benchmark...")
-    print(f"Command: {' '.join(cmd)}\n")
-
-    # Run and time
-    start_time = time.time()
-
-    result = subprocess.run(cmd, capture_output=False)
-
-    end_time = time.time()
-    elapsed = end_time - start_time
+    print("\nStarting benchmark...\n")
+
+    timings = []
+    failures = 0
+    for i in range(repeat):
+        start_time = time.perf_counter()
+        # main exits via sys.exit on pipeline errors; a failed run must not
+        # abort the loop and discard the timings already collected
+        try:
+            run(
+                profiles_path,
+                activities_path,
+                use_assignment=use_assignment,
+                assignment_method='hungarian' if use_assignment else 'auto',
+                extra_args=extra_args
+            )
+            exit_code = 0
+        except SystemExit as exc:
+            exit_code = exc.code if isinstance(exc.code, int) else 1
+
+        elapsed = time.perf_counter() - start_time
+        if exit_code == 0:
+            timings.append(elapsed)
+        else:
+            failures += 1
+            print(f"\nRun {i + 1} failed with exit code {exit_code} "
+                  f"after {elapsed:.2f} seconds")
 
     # Print results
     print("\n" + "="*80)
     print("BENCHMARK RESULTS")
     print("="*80)
-    print(f"Total execution time: {elapsed:.2f} seconds ({elapsed/60:.2f} minutes)")
-    print(f"Exit code: {result.returncode}")
+    if failures:
+        print(f"Failed runs: {failures} of {repeat}")
+    if not timings:
+        print("No successful runs - nothing to report")
+    elif len(timings) == 1:
+        elapsed = timings[0]
+        print(f"Total execution time: {elapsed:.2f} seconds ({elapsed/60:.2f} minutes)")
+    else:
+        print(f"Successful runs: {len(timings)} of {repeat}")
+        print(f"Min:    {min(timings):.2f} seconds")
+        print(f"Median: {statistics.median(timings):.2f} seconds")
+        print(f"Mean:   {statistics.mean(timings):.2f} seconds")
     print("="*80)
 
-    return elapsed
+    return timings
+
 
 if __name__ == '__main__':
     import argparse
@@ -61,11 +99,14 @@ if __name__ == '__main__':
     parser.add_argument('--profiles', required=True, help='Profiles CSV path')
     parser.add_argument('--activities', required=True, help='Activities CSV path')
     parser.add_argument('--no-assignment', action='store_true', help='Skip assignment')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='Number of timed runs (reports min/median/mean)')
 
     args = parser.parse_args()
 
     run_timed_benchmark(
         args.profiles,
         args.activities,
-        use_assignment=not args.no_assignment
+        use_assignment=not args.no_assignment,
+        repeat=args.repeat
     )
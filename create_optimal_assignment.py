@@ -10,6 +10,13 @@ import pandas as pd
 from src.core.optimal_assignment import OptimalAssignment
 from src.visualization.charts import ProfileVisualizer
 
+# Try to use the multithreaded PyArrow CSV parser (optional)
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
 
 def main():
     """
@@ -29,15 +36,20 @@ def main():
 
     # Load results
     print(f"\nLoading results from: {results_file}")
-    full_results_df = pd.read_csv(results_file, index_col=0)
+    full_results_df = pd.read_csv(results_file, index_col=0, engine=CSV_ENGINE)
 
     print(f"\nData loaded:")
     print(f"  - Activities: {len(full_results_df)}")
     print(f"  - Profiles: {len(full_results_df.columns)}")
 
-    # Create optimal assignment solver
+    # Create optimal assignment solver from the raw score matrix
+    # (the solver only needs the floats plus labels; skips a DataFrame copy)
     print("\n" + "="*80)
-    solver = OptimalAssignment(full_results_df)
+    solver = OptimalAssignment.from_numpy(
+        full_results_df.to_numpy(dtype=float, copy=False),
+        full_results_df.index,
+        full_results_df.columns
+    )
 
     # Solve optimal assignment
     # This will automatically use Hungarian if dimensions match,
@@ -9,12 +9,148 @@ Author: Abdel YEZZA (Ph.D)
 
 import numpy as np
 import pandas as pd
+from scipy.stats import truncnorm
 from pathlib import Path
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+# Try to import PyArrow for fast C-level CSV writing (optional)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Try to import Numba for a fused sampling kernel on large matrices (optional)
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Minimum number of cells before the Numba kernel pays for itself
+NUMBA_MIN_CELLS = 250_000
+
+if NUMBA_AVAILABLE:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _fill_skill_levels(data, loc, scale, seed):
+        """Fill data with normal(loc, scale) samples clipped to [0, 5] and
+        rounded to 1 decimal, fused into a single parallel pass."""
+        np.random.seed(seed)
+        n_rows, n_cols = data.shape
+        for i in numba.prange(n_rows):
+            for j in range(n_cols):
+                value = np.random.normal(loc, scale)
+                if value < 0.0:
+                    value = 0.0
+                elif value > 5.0:
+                    value = 5.0
+                data[i, j] = np.rint(value * 10.0) / 10.0
+
+
+def write_dataset_csv(df: pd.DataFrame, output_path: Path):
+    """
+    Write a dataset DataFrame to CSV.
+
+    Uses PyArrow's parallel C formatter when available (5-10x faster than
+    pandas on large frames). Without PyArrow, falls back to a single bulk
+    np.savetxt call: every data column shares the same '%.1f' format, so one
+    formatted write beats pandas' per-cell CSV formatter. Output is
+    pd.read_csv-compatible either way.
+
+    Args:
+        df: DataFrame to write (index becomes the first column)
+        output_path: Path to save the CSV file
+    """
+    if PYARROW_AVAILABLE:
+        pa_csv.write_csv(pa.Table.from_pandas(df.reset_index()), str(output_path))
+    else:
+        header = ','.join([df.index.name or ''] + list(df.columns))
+        rows = np.concatenate(
+            [df.index.to_numpy(dtype=object).reshape(-1, 1),
+             df.to_numpy(dtype=object)],
+            axis=1
+        )
+        np.savetxt(output_path, rows, fmt=['%s'] + ['%.1f'] * df.shape[1],
+                   delimiter=',', header=header, comments='')
+
+
+def quantize_skill_levels(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Quantize a skill-level DataFrame to int16 (levels x 10).
+
+    Skill levels are one-decimal values in [0.0, 5.0] — only 51 distinct
+    values — so storing them as integers in [0, 50] is lossless and cuts
+    memory 4x vs float64 (2x vs float32). Use as_float_skill_levels() to get
+    back the float representation the TOPSIS pipeline consumes.
+
+    Args:
+        df: DataFrame of float skill levels in [0.0, 5.0]
+
+    Returns:
+        DataFrame with the same index/columns holding int16 levels x 10
+    """
+    data = df.to_numpy(dtype=np.float64, copy=True)
+    np.multiply(data, 10.0, out=data)
+    np.rint(data, out=data)
+    np.clip(data, 0, 50, out=data)
+    return pd.DataFrame(data.astype(np.int16), index=df.index,
+                        columns=df.columns, copy=False)
+
+
+def as_float_skill_levels(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert a quantized int16 DataFrame back to float32 levels in [0, 5].
+
+    Args:
+        df: DataFrame of int16 levels x 10 (see quantize_skill_levels)
+
+    Returns:
+        DataFrame of float32 skill levels
+    """
+    return pd.DataFrame(df.to_numpy(dtype=np.float32) * np.float32(0.1),
+                        index=df.index, columns=df.columns, copy=False)
+
+
+def _sample_truncated_normal(rng: np.random.Generator, loc: float, scale: float,
+                             size: tuple) -> np.ndarray:
+    """
+    Draw skill levels from a normal(loc, scale) truncated to [0, 5],
+    rounded to 1 decimal place.
+
+    Args:
+        rng: Generator instance driving the draw
+        loc: Mean of the underlying normal
+        scale: Standard deviation of the underlying normal
+        size: Output shape
+
+    Returns:
+        float32 array of one-decimal levels in [0.0, 5.0]
+    """
+    a, b = (0.0 - loc) / scale, (5.0 - loc) / scale
+    data = truncnorm.rvs(a, b, loc=loc, scale=scale, size=size,
+                         random_state=rng).astype(np.float32)
+    np.round(data, 1, out=data)
+    return data
+
+
+def make_skill_names(n_skills: int) -> pd.Index:
+    """
+    Build the shared skill names index (Skill_1 ... Skill_N).
+
+    Args:
+        n_skills: Number of skills
 
-def generate_random_profiles(n_profiles: int, n_skills: int, output_path: Path, seed: int = 42) -> pd.DataFrame:
+    Returns:
+        Index of skill names (vectorized construction, no Python loop)
+    """
+    return "Skill_" + pd.RangeIndex(1, n_skills + 1).astype(str)
+
+
+def generate_random_profiles(n_profiles: int, n_skills: int, output_path: Path, seed: int = 42,
+                             skill_names: pd.Index = None, write_csv: bool = True) -> pd.DataFrame:
     """
     Generate random profiles dataset.
 
@@ -23,39 +159,47 @@ def generate_random_profiles(n_profiles: int, n_skills: int, output_path: Path,
         n_skills: Number of skills per profile
         output_path: Path to save the CSV file
         seed: Random seed for reproducibility
+        skill_names: Prebuilt skill names index (built if not provided)
+        write_csv: If False, skip the CSV write (in-memory use, e.g. benchmarks)
 
     Returns:
         DataFrame with random profiles
     """
-    np.random.seed(seed)
+    rng = np.random.default_rng(seed)
 
     print(f"\nGenerating {n_profiles} profiles with {n_skills} skills...")
 
-    # Generate profile names
-    profile_names = [f"Profile_{i+1}" for i in range(n_profiles)]
+    # Generate profile names (vectorized: formatted in C, no per-name Python loop)
+    profile_names = "Profile_" + pd.RangeIndex(1, n_profiles + 1).astype(str)
 
-    # Generate skill names
-    skill_names = [f"Skill_{i+1}" for i in range(n_skills)]
+    # Generate skill names (built once by the caller when possible)
+    if skill_names is None:
+        skill_names = make_skill_names(n_skills)
 
     # Generate random skill levels (0.0 to 5.0)
     # Using normal distribution centered at 2.5 to get realistic spread
-    data = np.random.normal(loc=2.5, scale=1.0, size=(n_profiles, n_skills))
-
-    # Clip values to [0, 5] range
-    data = np.clip(data, 0.0, 5.0)
-
-    # Round to 1 decimal place
-    data = np.round(data, 1)
-
-    # Create DataFrame
-    df = pd.DataFrame(data, columns=skill_names, index=profile_names)
+    # float32 halves memory/bandwidth; ample precision for 1-decimal levels in [0, 5]
+    if NUMBA_AVAILABLE and n_profiles * n_skills >= NUMBA_MIN_CELLS:
+        # Fused sample+clip+round kernel: one parallel pass over the buffer
+        data = np.empty((n_profiles, n_skills), dtype=np.float32)
+        _fill_skill_levels(data, 2.5, 1.0, seed)
+    else:
+        # Truncated normal on [0, 5]: one vectorized draw with no clip pass,
+        # and no mass piled on the boundaries the way normal+clip does
+        data = _sample_truncated_normal(rng, loc=2.5, scale=1.0,
+                                        size=(n_profiles, n_skills))
+
+    # Create DataFrame without copying the buffer; keep it C-contiguous so
+    # downstream row-per-profile access stays cache-friendly
+    df = pd.DataFrame(np.ascontiguousarray(data), columns=skill_names,
+                      index=profile_names, copy=False)
     df.index.name = 'Profile'
 
-    # Save to CSV
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(output_path)
-
-    print(f"  [OK] Profiles saved to: {output_path}")
+    # Save to CSV (skipped for pure in-memory consumers)
+    if write_csv:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        write_dataset_csv(df, output_path)
+        print(f"  [OK] Profiles saved to: {output_path}")
     print(f"  Shape: {df.shape}")
     print(f"  Skill range: [{df.min().min():.1f}, {df.max().max():.1f}]")
     print(f"  Mean skill level: {df.mean().mean():.2f}")
@@ -63,7 +207,8 @@ def generate_random_profiles(n_profiles: int, n_skills: int, output_path: Path,
     return df
 
 
-def generate_random_activities(n_activities: int, n_skills: int, output_path: Path, seed: int = 42) -> pd.DataFrame:
+def generate_random_activities(n_activities: int, n_skills: int, output_path: Path, seed: int = 42,
+                               skill_names: pd.Index = None, write_csv: bool = True) -> pd.DataFrame:
     """
     Generate random activities dataset.
 
@@ -72,39 +217,47 @@ def generate_random_activities(n_activities: int, n_skills: int, output_path: Pa
         n_skills: Number of skill requirements per activity
         output_path: Path to save the CSV file
         seed: Random seed for reproducibility
+        skill_names: Prebuilt skill names index (built if not provided)
+        write_csv: If False, skip the CSV write (in-memory use, e.g. benchmarks)
 
     Returns:
         DataFrame with random activities
     """
-    np.random.seed(seed + 1)  # Different seed than profiles
+    rng = np.random.default_rng(seed + 1)  # Different seed than profiles
 
     print(f"\nGenerating {n_activities} activities with {n_skills} skill requirements...")
 
-    # Generate activity names
-    activity_names = [f"Activity_{i+1}" for i in range(n_activities)]
+    # Generate activity names (vectorized: formatted in C, no per-name Python loop)
+    activity_names = "Activity_" + pd.RangeIndex(1, n_activities + 1).astype(str)
 
-    # Generate skill names (same as profiles)
-    skill_names = [f"Skill_{i+1}" for i in range(n_skills)]
+    # Generate skill names (same as profiles, built once by the caller when possible)
+    if skill_names is None:
+        skill_names = make_skill_names(n_skills)
 
     # Generate random skill requirements (0.0 to 5.0)
     # Activities tend to have higher requirements, so center at 3.0
-    data = np.random.normal(loc=3.0, scale=1.2, size=(n_activities, n_skills))
-
-    # Clip values to [0, 5] range
-    data = np.clip(data, 0.0, 5.0)
-
-    # Round to 1 decimal place
-    data = np.round(data, 1)
-
-    # Create DataFrame
-    df = pd.DataFrame(data, columns=skill_names, index=activity_names)
+    # float32 halves memory/bandwidth; ample precision for 1-decimal levels in [0, 5]
+    if NUMBA_AVAILABLE and n_activities * n_skills >= NUMBA_MIN_CELLS:
+        # Fused sample+clip+round kernel: one parallel pass over the buffer
+        data = np.empty((n_activities, n_skills), dtype=np.float32)
+        _fill_skill_levels(data, 3.0, 1.2, seed + 1)
+    else:
+        # Truncated normal on [0, 5]: one vectorized draw with no clip pass,
+        # and no mass piled on the boundaries the way normal+clip does
+        data = _sample_truncated_normal(rng, loc=3.0, scale=1.2,
+                                        size=(n_activities, n_skills))
+
+    # Create DataFrame without copying the buffer; keep it C-contiguous so
+    # downstream row-per-activity access stays cache-friendly
+    df = pd.DataFrame(np.ascontiguousarray(data), columns=skill_names,
+                      index=activity_names, copy=False)
     df.index.name = 'Activity'
 
-    # Save to CSV
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(output_path)
-
-    print(f"  [OK] Activities saved to: {output_path}")
+    # Save to CSV (skipped for pure in-memory consumers)
+    if write_csv:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        write_dataset_csv(df, output_path)
+        print(f"  [OK] Activities saved to: {output_path}")
     print(f"  Shape: {df.shape}")
     print(f"  Requirement range: [{df.min().min():.1f}, {df.max().max():.1f}]")
     print(f"  Mean requirement level: {df.mean().mean():.2f}")
@@ -118,7 +271,8 @@ def generate_dataset_pair(
     n_skills: int,
     output_dir: Path,
     prefix: str = "large",
-    seed: int = 42
+    seed: int = 42,
+    write_csv: bool = True
 ):
     """
     Generate a pair of matching profiles and activities datasets.
@@ -130,6 +284,7 @@ def generate_dataset_pair(
         output_dir: Output directory
         prefix: Filename prefix
         seed: Random seed
+        write_csv: If False, skip CSV writes and only return the DataFrames
     """
     print("="*80)
     print(f"GENERATING LARGE RANDOM DATASET: {prefix}")
@@ -141,25 +296,39 @@ def generate_dataset_pair(
     print(f"  Total data points: {(n_profiles + n_activities) * n_skills:,}")
     print(f"  Random seed: {seed}")
 
-    # Generate profiles
-    profiles_path = output_dir / f"{prefix}_profiles.csv"
-    profiles_df = generate_random_profiles(n_profiles, n_skills, profiles_path, seed)
+    # Build skill names once (shared between profiles and activities)
+    skill_names = make_skill_names(n_skills)
 
-    # Generate activities
+    # Generate profiles and activities concurrently: the two are independent
+    # (separate RNG instances via seed/seed+1) and NumPy sampling plus the
+    # CSV writes release the GIL, so both run in parallel on multi-core.
+    profiles_path = output_dir / f"{prefix}_profiles.csv"
     activities_path = output_dir / f"{prefix}_activities.csv"
-    activities_df = generate_random_activities(n_activities, n_skills, activities_path, seed)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        profiles_future = executor.submit(
+            generate_random_profiles, n_profiles, n_skills, profiles_path, seed,
+            skill_names=skill_names, write_csv=write_csv)
+        activities_future = executor.submit(
+            generate_random_activities, n_activities, n_skills, activities_path, seed,
+            skill_names=skill_names, write_csv=write_csv)
+
+        profiles_df = profiles_future.result()
+        activities_df = activities_future.result()
 
     # Print statistics
     print("\n" + "="*80)
     print("DATASET GENERATION COMPLETE")
     print("="*80)
-    print(f"Files created:")
-    print(f"  1. {profiles_path}")
-    print(f"  2. {activities_path}")
+    if write_csv:
+        print(f"Files created:")
+        print(f"  1. {profiles_path}")
+        print(f"  2. {activities_path}")
     print(f"\nDataset info:")
     print(f"  Profiles shape: {profiles_df.shape}")
     print(f"  Activities shape: {activities_df.shape}")
-    print(f"  Files size: ~{(profiles_path.stat().st_size + activities_path.stat().st_size) / 1024:.1f} KB")
+    if write_csv:
+        print(f"  Files size: ~{(profiles_path.stat().st_size + activities_path.stat().st_size) / 1024:.1f} KB")
     print("="*80)
 
     return profiles_df, activities_df
@@ -230,6 +399,12 @@ Examples:
         help='Random seed for reproducibility (default: 42)'
     )
 
+    parser.add_argument(
+        '-y', '--yes',
+        action='store_true',
+        help='Skip the large-dataset confirmation prompt (for CI/scripted runs)'
+    )
+
     args = parser.parse_args()
 
     # Validate inputs
@@ -239,7 +414,7 @@ Examples:
 
     # Warning for very large datasets
     total_cells = (args.profiles + args.activities) * args.skills
-    if total_cells > 10_000_000:  # > 10 million cells
+    if total_cells > 10_000_000 and not args.yes:  # > 10 million cells
         print(f"\n⚠️  WARNING: Large dataset detected ({total_cells:,} total data points)")
         print("    This may take significant time and memory.")
         response = input("    Continue? (y/n): ")
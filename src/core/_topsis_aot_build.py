@@ -0,0 +1,30 @@
+"""
+AOT build script for the fused TOPSIS kernel
+
+Compiles _topsis_core into a C extension (_topsis_aot) so the fast path
+in TopsisEngine.calculate pays no JIT warm-up on first call. The JIT and
+pure-Python versions remain the fallbacks, so building is optional.
+
+Usage (from the project root):
+    python -m src.core._topsis_aot_build
+
+Author: Abdel YEZZA (Ph.D)
+"""
+
+from numba.pycc import CC
+
+from .topsis_engine import _topsis_core_py
+
+cc = CC('_topsis_aot')
+
+# One export per supported floating dtype; criteria types are int64
+_SIG_F8 = 'void(f8[:,:], f8[:], i8[:], f8[:], f8[:], f8[:], f8[:])'
+_SIG_F4 = 'void(f4[:,:], f4[:], i8[:], f4[:], f4[:], f4[:], f4[:])'
+
+cc.export('topsis_core_f8', _SIG_F8)(_topsis_core_py)
+cc.export('topsis_core_f4', _SIG_F4)(_topsis_core_py)
+
+
+if __name__ == '__main__':
+    cc.compile()
+    print(f"Built AOT extension: {cc.output_file}")
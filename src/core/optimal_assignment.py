@@ -5,11 +5,61 @@ using Hungarian Algorithm (when dimensions match) or greedy approach
 Author: Abdel YEZZA (Ph.D)
 """
 
+import csv
+import sys
+
 import numpy as np
 import pandas as pd
 from typing import Dict, Tuple, Optional
 from scipy.optimize import linear_sum_assignment
 
+# Try to use numba to JIT-compile the greedy scan (optional)
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _greedy_scan(rows, cols, n_activities, n_profiles):
+    """
+    Scan score-ordered (row, col) pairs and keep each first-free pair.
+
+    Args:
+        rows: Activity indices sorted by descending score
+        cols: Profile indices sorted by descending score
+        n_activities: Number of activities
+        n_profiles: Number of profiles
+
+    Returns:
+        Tuple of (chosen activity indices, chosen profile indices)
+    """
+    act_taken = np.zeros(n_activities, dtype=np.bool_)
+    prof_taken = np.zeros(n_profiles, dtype=np.bool_)
+    limit = min(n_activities, n_profiles)
+    chosen_rows = np.empty(limit, dtype=np.int64)
+    chosen_cols = np.empty(limit, dtype=np.int64)
+    count = 0
+
+    for k in range(rows.size):
+        r = rows[k]
+        c = cols[k]
+        if act_taken[r] or prof_taken[c]:
+            continue
+        act_taken[r] = True
+        prof_taken[c] = True
+        chosen_rows[count] = r
+        chosen_cols[count] = c
+        count += 1
+        if count == limit:
+            break
+
+    return chosen_rows[:count], chosen_cols[:count]
+
+
+if NUMBA_AVAILABLE:
+    _greedy_scan = numba.njit(cache=True)(_greedy_scan)
+
 
 class OptimalAssignment:
     """
@@ -24,16 +74,60 @@ class OptimalAssignment:
             full_results_df: DataFrame with activities as rows, profiles as columns
                            containing TOPSIS proximity coefficients
         """
-        self.full_results_df = full_results_df.copy()
-        self.activities = full_results_df.index.tolist() # activities are rows
-        self.profiles = full_results_df.columns.tolist() # profiles are columns
-        self.n_activities = len(self.activities)
-        self.n_profiles = len(self.profiles)
+        # One defensive copy of the float buffer instead of a full
+        # DataFrame.copy; the public DataFrame then wraps the same array
+        self._init_from(
+            full_results_df.to_numpy(dtype=np.float64, copy=True),
+            full_results_df.index.tolist(),   # activities are rows
+            full_results_df.columns.tolist()  # profiles are columns
+        )
+        self.full_results_df = pd.DataFrame(
+            self.cost_matrix,
+            index=full_results_df.index,
+            columns=full_results_df.columns,
+            copy=False
+        )
+
+    @classmethod
+    def from_numpy(cls, cost_matrix: np.ndarray, row_labels, col_labels) -> 'OptimalAssignment':
+        """
+        Build a solver directly from a raw score matrix, bypassing pandas.
+
+        The solvers only need the float matrix plus the row/column labels, so
+        callers that already hold a numpy array avoid a DataFrame copy.
+
+        Args:
+            cost_matrix: 2D array of proximity coefficients (activities x profiles)
+            row_labels: Activity names (rows)
+            col_labels: Profile names (columns)
+
+        Returns:
+            OptimalAssignment instance
+        """
+        solver = cls.__new__(cls)
+        solver.full_results_df = None
+        solver._init_from(np.asarray(cost_matrix, dtype=np.float64),
+                          list(row_labels), list(col_labels))
+        return solver
+
+    def _init_from(self, cost_matrix: np.ndarray, activities: list, profiles: list):
+        """Shared initialization from the raw score matrix and labels."""
+        # C-contiguous float64 up front, so scipy's LAP solver (and our own
+        # flattened argsort) work on the buffer without an internal copy
+        self.cost_matrix = np.ascontiguousarray(cost_matrix)
+        self.activities = activities
+        self.profiles = profiles
+        self.n_activities = len(activities)
+        self.n_profiles = len(profiles)
 
         self.assignment = None
         self.assignment_method = None
         self.total_score = None
 
+        # Lazily-built (rows, cols, scores) arrays for the current
+        # assignment, shared by the matrix getters
+        self._idx_cache = None
+
     def check_dimensions(self) -> Tuple[bool, str]:
         """
         Check if dimensions allow for Hungarian Algorithm.
@@ -54,12 +148,11 @@ class OptimalAssignment:
         Returns:
             Dictionary with assignment results
         """
-        # Convert DataFrame to numpy array
-        cost_matrix = self.full_results_df.values
+        cost_matrix = self.cost_matrix
 
-        # Hungarian algorithm minimizes, so we negate for maximization (Min Cost = -Max(-Cost))
-        # We use negative values because linear_sum_assignment minimizes
-        row_ind, col_ind = linear_sum_assignment(-cost_matrix)
+        # linear_sum_assignment minimizes by default; maximize=True flips it
+        # internally without materializing a negated copy of the matrix
+        row_ind, col_ind = linear_sum_assignment(cost_matrix, maximize=True)
 
         # Build assignment dictionary
         assignment = {}
@@ -79,6 +172,7 @@ class OptimalAssignment:
             total_score += score
 
         self.assignment = assignment
+        self._idx_cache = None
         self.assignment_method = 'hungarian'
         self.total_score = total_score
 
@@ -99,38 +193,73 @@ class OptimalAssignment:
             Dictionary with assignment results
         """
         assignment = {}
-        assigned_profiles = set()
         total_score = 0.0
 
-        # Create a sorted list of (activity, profile, score) tuples
-        candidates = []
-        for activity in self.activities:
-            for profile in self.profiles:
-                score = self.full_results_df.loc[activity, profile]
-                candidates.append((activity, profile, score))
-
-        # Sort by score in descending order
-        candidates.sort(key=lambda x: x[2], reverse=True)
-
-        # Greedy assignment
-        assigned_activities = set()
-        for activity, profile, score in candidates:
-            if activity not in assigned_activities and profile not in assigned_profiles:
-                assignment[activity] = {
-                    'profile': profile,
+        cost_matrix = self.cost_matrix
+
+        # Happy path: when every activity's top profile is distinct (common
+        # with well-separated scores), that is exactly what the greedy scan
+        # would pick, so build the assignment straight from the row argmax
+        # and skip the full O(n^2 log n) sort
+        best = cost_matrix.argmax(axis=1)
+        if (self.n_activities <= self.n_profiles
+                and np.unique(best).size == self.n_activities):
+            assigned_profiles = set()
+            for r in range(self.n_activities):
+                c = int(best[r])
+                score = cost_matrix[r, c]
+                assignment[self.activities[r]] = {
+                    'profile': self.profiles[c],
                     'score': score,
-                    'activity_idx': self.activities.index(activity),
-                    'profile_idx': self.profiles.index(profile)
+                    'activity_idx': r,
+                    'profile_idx': c
                 }
-                assigned_activities.add(activity)
-                assigned_profiles.add(profile)
+                assigned_profiles.add(self.profiles[c])
                 total_score += score
 
-                # Stop when all activities are assigned
-                if len(assigned_activities) == self.n_activities:
-                    break
+            self.assignment = assignment
+            self._idx_cache = None
+            self.assignment_method = 'greedy'
+            self.total_score = total_score
+
+            return {
+                'method': 'greedy',
+                'assignment': assignment,
+                'total_score': total_score,
+                'average_score': total_score / len(assignment) if assignment else 0,
+                'n_assignments': len(assignment),
+                'unassigned_profiles': list(set(self.profiles) - assigned_profiles)
+            }
+
+        # Rank all (activity, profile) pairs by score in one C-level argsort
+        # over the flattened matrix instead of building and sorting a Python
+        # list of n_activities * n_profiles tuples
+        order = np.argsort(-cost_matrix, axis=None, kind='stable')
+        rows, cols = np.unravel_index(order, cost_matrix.shape)
+
+        # Greedy scan: take the best-scoring pair whose activity and profile
+        # are both still free (JIT-compiled when numba is installed, plain
+        # NumPy boolean masks otherwise)
+        chosen_rows, chosen_cols = _greedy_scan(
+            rows.astype(np.int64, copy=False),
+            cols.astype(np.int64, copy=False),
+            self.n_activities, self.n_profiles
+        )
+
+        assigned_profiles = set()
+        for r, c in zip(chosen_rows.tolist(), chosen_cols.tolist()):
+            score = cost_matrix[r, c]
+            assignment[self.activities[r]] = {
+                'profile': self.profiles[c],
+                'score': score,
+                'activity_idx': r,
+                'profile_idx': c
+            }
+            assigned_profiles.add(self.profiles[c])
+            total_score += score
 
         self.assignment = assignment
+        self._idx_cache = None
         self.assignment_method = 'greedy'
         self.total_score = total_score
 
@@ -143,13 +272,105 @@ class OptimalAssignment:
             'unassigned_profiles': list(set(self.profiles) - assigned_profiles)
         }
 
+    def solve_auction(self) -> Dict:
+        """
+        Solve assignment approximately with the Bertsekas auction algorithm.
+
+        Runs in roughly O(n^2 log n) versus O(n^3) for Hungarian, at the cost
+        of a bounded optimality gap (shrunk by epsilon scaling), so it is the
+        method of choice for very large matrices. Requires at least as many
+        profiles as activities.
+
+        Returns:
+            Dictionary with assignment results
+        """
+        if self.n_activities > self.n_profiles:
+            raise ValueError(
+                "Auction algorithm needs n_profiles >= n_activities "
+                f"({self.n_activities} activities > {self.n_profiles} profiles)")
+
+        cost_matrix = self.cost_matrix
+        prices = np.zeros(self.n_profiles)
+        owner = np.full(self.n_profiles, -1, dtype=np.intp)
+
+        # Epsilon scaling: start coarse and halve until below 1/(n+1), reusing
+        # the learned prices between phases (assignments are rebuilt each phase)
+        epsilon = max(float(np.abs(cost_matrix).max()), 1.0) / 2.0
+        min_epsilon = 1.0 / (self.n_activities + 1)
+
+        while True:
+            owner[:] = -1
+            unassigned = list(range(self.n_activities))
+
+            while unassigned:
+                activity_idx = unassigned.pop()
+
+                # Best and second-best net value for this bidder
+                values = cost_matrix[activity_idx] - prices
+                best_j = int(np.argmax(values))
+                best_value = values[best_j]
+                if self.n_profiles > 1:
+                    values[best_j] = -np.inf
+                    second_value = float(values.max())
+                else:
+                    second_value = best_value - epsilon
+
+                # Raise the price by the bid increment and take ownership
+                prices[best_j] += best_value - second_value + epsilon
+                previous = owner[best_j]
+                owner[best_j] = activity_idx
+                if previous >= 0:
+                    unassigned.append(int(previous))
+
+            if epsilon <= min_epsilon:
+                break
+            epsilon /= 2.0
+
+        # Build assignment dictionary from profile ownership
+        assignment = {}
+        total_score = 0.0
+        assigned_profiles = set()
+
+        for profile_idx in np.flatnonzero(owner >= 0):
+            profile_idx = int(profile_idx)
+            activity_idx = int(owner[profile_idx])
+            score = cost_matrix[activity_idx, profile_idx]
+
+            assignment[self.activities[activity_idx]] = {
+                'profile': self.profiles[profile_idx],
+                'score': score,
+                'activity_idx': activity_idx,
+                'profile_idx': profile_idx
+            }
+            assigned_profiles.add(self.profiles[profile_idx])
+            total_score += score
+
+        self.assignment = assignment
+        self._idx_cache = None
+        self.assignment_method = 'auction'
+        self.total_score = total_score
+
+        return {
+            'method': 'auction',
+            'assignment': assignment,
+            'total_score': total_score,
+            'average_score': total_score / len(assignment) if assignment else 0,
+            'n_assignments': len(assignment),
+            'unassigned_profiles': list(set(self.profiles) - assigned_profiles)
+        }
+
+    # Above this many cells, Hungarian's O(n^3) gets painful and the
+    # near-optimal auction algorithm is auto-selected instead
+    AUCTION_MIN_CELLS = 10**6
+
     def solve(self, force_method: Optional[str] = None) -> Dict:
         """
         Solve optimal assignment problem automatically.
         Uses Hungarian if dimensions match, otherwise greedy.
 
         Args:
-            force_method: If specified, force use of 'hungarian' or 'greedy'
+            force_method: If specified, force use of 'hungarian', 'greedy'
+                          or 'auction'
 
         Returns:
             Dictionary with assignment results
@@ -173,15 +394,51 @@ class OptimalAssignment:
         elif force_method == 'greedy':
             print("\nUsing Greedy Approach (forced)...")
             return self.solve_greedy()
+        elif force_method == 'auction':
+            print("\nUsing Auction Algorithm (forced)...")
+            return self.solve_auction()
         else:
             # Auto-select method
-            if can_use_hungarian:
+            large_problem = (
+                self.n_activities * self.n_profiles > self.AUCTION_MIN_CELLS
+                and self.n_activities <= self.n_profiles
+            )
+            if large_problem:
+                print("\nUsing Auction Algorithm (near-optimal) for large matrix...")
+                return self.solve_auction()
+            elif can_use_hungarian:
                 print("\nUsing Hungarian Algorithm for optimal 1-to-1 assignment...")
                 return self.solve_hungarian()
             else:
                 print("\nUsing Greedy Approach for best-effort assignment...")
                 return self.solve_greedy()
 
+    def _get_idx_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Extract (rows, cols, scores) arrays from the current assignment.
+
+        Built lazily on first access and memoized until the next solve, so
+        get_assignment_matrix and get_assignment_scores share one pass over
+        the assignment dict.
+
+        Returns:
+            Tuple of (activity indices, profile indices, scores)
+        """
+        if self._idx_cache is None:
+            n = len(self.assignment)
+            rows = np.fromiter(
+                (info['activity_idx'] for info in self.assignment.values()),
+                dtype=np.intp, count=n)
+            cols = np.fromiter(
+                (info['profile_idx'] for info in self.assignment.values()),
+                dtype=np.intp, count=n)
+            scores = np.fromiter(
+                (info['score'] for info in self.assignment.values()),
+                dtype=np.float64, count=n)
+            self._idx_cache = (rows, cols, scores)
+
+        return self._idx_cache
+
     def get_assignment_matrix(self) -> pd.DataFrame:
         """
         Create a binary matrix showing the optimal assignment.
@@ -192,19 +449,16 @@ class OptimalAssignment:
         if self.assignment is None:
             raise ValueError("No assignment computed yet. Run solve() first.")
 
-        # Create zero matrix
-        assignment_matrix = pd.DataFrame(
-            0,
-            index=self.activities,
-            columns=self.profiles
-        )
+        # Fill a NumPy array by integer index in one shot; per-cell .loc
+        # writes each pay a pandas label lookup and dtype check
+        rows, cols, _ = self._get_idx_arrays()
 
-        # Fill in assignments
-        for activity, info in self.assignment.items():
-            profile = info['profile']
-            assignment_matrix.loc[activity, profile] = 1
+        # int8 is plenty for a 0/1 indicator matrix and cuts memory and
+        # bandwidth 8x versus the default int64
+        arr = np.zeros((self.n_activities, self.n_profiles), dtype=np.int8)
+        arr[rows, cols] = 1
 
-        return assignment_matrix
+        return pd.DataFrame(arr, index=self.activities, columns=self.profiles)
 
     def get_assignment_scores(self) -> pd.DataFrame:
         """
@@ -216,20 +470,13 @@ class OptimalAssignment:
         if self.assignment is None:
             raise ValueError("No assignment computed yet. Run solve() first.")
 
-        # Create zero matrix
-        score_matrix = pd.DataFrame(
-            0.0,
-            index=self.activities,
-            columns=self.profiles
-        )
+        # Same integer-indexed fill as get_assignment_matrix
+        rows, cols, scores = self._get_idx_arrays()
 
-        # Fill in scores for assigned pairs
-        for activity, info in self.assignment.items():
-            profile = info['profile']
-            score = info['score']
-            score_matrix.loc[activity, profile] = score
+        arr = np.zeros((self.n_activities, self.n_profiles), dtype=np.float64)
+        arr[rows, cols] = scores
 
-        return score_matrix
+        return pd.DataFrame(arr, index=self.activities, columns=self.profiles)
 
     def print_results(self):
         """
@@ -249,13 +496,15 @@ class OptimalAssignment:
         print(f"\n{'Activity':<30} {'Profile':<30} {'Score':<15}")
         print(f"{'-'*80}")
 
-        # Sort by activity name
+        # Sort by activity name, format every row up front and emit the
+        # whole table in one write instead of one print call per assignment
         sorted_assignment = sorted(self.assignment.items(), key=lambda x: x[0])
 
-        for activity, info in sorted_assignment:
-            profile = info['profile']
-            score = info['score']
-            print(f"{activity:<30} {profile:<30} {score:<15.6f}")
+        rows = [
+            f"{activity:<30} {info['profile']:<30} {info['score']:<15.6f}"
+            for activity, info in sorted_assignment
+        ]
+        sys.stdout.write('\n'.join(rows) + '\n')
 
         print(f"{'='*80}")
 
@@ -289,20 +538,21 @@ class OptimalAssignment:
         df = pd.DataFrame(results_data)
         df = df.sort_values('Activity')
 
-        # Add summary statistics at the end
+        df.to_csv(output_path, index=False)
+
+        # Append the summary statistics directly; concatenating a summary
+        # DataFrame would copy the whole assignment table for 6 extra rows
         summary_rows = [
-            {'Activity': '', 'Assigned_Profile': '', 'Score': ''},
-            {'Activity': 'SUMMARY', 'Assigned_Profile': '', 'Score': ''},
-            {'Activity': 'Method', 'Assigned_Profile': self.assignment_method.upper(), 'Score': ''},
-            {'Activity': 'Total Assignments', 'Assigned_Profile': str(len(self.assignment)), 'Score': ''},
-            {'Activity': 'Sum of Proximity Values', 'Assigned_Profile': '(All Assigned Pairs)', 'Score': f'{self.total_score:.6f}'},
-            {'Activity': 'Average Proximity', 'Assigned_Profile': '(Per Assignment)', 'Score': f'{self.total_score / len(self.assignment):.6f}'}
+            ['', '', ''],
+            ['SUMMARY', '', ''],
+            ['Method', self.assignment_method.upper(), ''],
+            ['Total Assignments', str(len(self.assignment)), ''],
+            ['Sum of Proximity Values', '(All Assigned Pairs)', f'{self.total_score:.6f}'],
+            ['Average Proximity', '(Per Assignment)', f'{self.total_score / len(self.assignment):.6f}']
         ]
 
-        summary_df = pd.DataFrame(summary_rows)
-        df_with_summary = pd.concat([df, summary_df], ignore_index=True)
-
-        df_with_summary.to_csv(output_path, index=False)
+        with open(output_path, 'a', newline='') as f:
+            csv.writer(f).writerows(summary_rows)
 
         print(f"\nAssignment results saved to: {output_path}")
         print(f"  -> Includes summary: Total Score = {self.total_score:.6f}")
@@ -7,6 +7,42 @@ Author: Abdel YEZZA (Ph.D) - Combined System
 import numpy as np
 from typing import Dict, List, Tuple
 
+# Try to use numba to JIT-compile the classify-and-count kernel (optional)
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _classify_count(required_levels, threshold):
+    """
+    Fused classify-and-count pass over one activity's requirements.
+
+    One loop produces the 0/1 criteria-type vector and the beneficial tally
+    together, instead of a comparison pass followed by a separate count
+    reduction.
+
+    Args:
+        required_levels: Float array of required skill levels
+        threshold: Beneficial/non-beneficial cut-off
+
+    Returns:
+        Tuple (criteria_types int8 array, n_beneficial)
+    """
+    n = required_levels.size
+    types = np.empty(n, np.int8)
+    n_beneficial = 0
+    for i in range(n):
+        b = 1 if required_levels[i] >= threshold else 0
+        types[i] = b
+        n_beneficial += b
+    return types, n_beneficial
+
+
+if NUMBA_AVAILABLE:
+    _classify_count = numba.njit(cache=True)(_classify_count)
+
 
 class SkillTransformer:
     """
@@ -59,15 +95,56 @@ class SkillTransformer:
         Returns:
             Array of criteria types (1=beneficial, 0=non-beneficial)
         """
-        criteria_types = np.zeros(len(required_skill_levels), dtype=int)
+        # One vectorized comparison instead of a per-element Python loop;
+        # int8 is enough for a 0/1 flag array
+        required_skill_levels = np.asarray(required_skill_levels)
+        return (required_skill_levels >= self.threshold).astype(np.int8)
+
+    def determine_criteria_types_batch(
+        self,
+        skill_matrix: np.ndarray
+    ) -> np.ndarray:
+        """
+        Determine criteria types for many activities in one call.
+
+        One whole-matrix comparison replaces n_activities separate calls,
+        so bulk analyses (all activities against all candidates) stay a
+        single C-level kernel regardless of how many activities there are.
+
+        Args:
+            skill_matrix: 2D array (activities x skills) of required levels
+
+        Returns:
+            2D array of criteria types (1=beneficial, 0=non-beneficial)
+        """
+        skill_matrix = np.asarray(skill_matrix)
+        return (skill_matrix >= self.threshold).astype(np.int8)
 
-        for i, skill_level in enumerate(required_skill_levels):
-            if skill_level >= self.threshold:
-                criteria_types[i] = 1  # Beneficial (maximize)
-            else:
-                criteria_types[i] = 0  # Non-beneficial (minimize)
+    def classify_and_count(
+        self,
+        required_skill_levels: np.ndarray
+    ) -> Tuple[np.ndarray, int, int]:
+        """
+        Determine criteria types together with the beneficial tallies.
 
-        return criteria_types
+        With numba installed this runs as one fused compiled loop; the
+        fallback is the vectorized comparison followed by a count reduction.
+
+        Args:
+            required_skill_levels: Array of required skill levels for an activity
+
+        Returns:
+            Tuple of (criteria_types, n_beneficial, n_non_beneficial)
+        """
+        required_skill_levels = np.asarray(required_skill_levels, dtype=np.float64)
+        if NUMBA_AVAILABLE:
+            types, n_beneficial = _classify_count(
+                required_skill_levels, self.threshold)
+        else:
+            types = (required_skill_levels >= self.threshold).astype(np.int8)
+            n_beneficial = np.count_nonzero(types)
+        n_beneficial = int(n_beneficial)
+        return types, n_beneficial, types.size - n_beneficial
 
     def get_criteria_info(
         self,
@@ -87,13 +164,22 @@ class SkillTransformer:
         criteria_types = self.determine_criteria_types(required_skill_levels)
         criteria_info = []
 
-        for i, (name, level, ctype) in enumerate(zip(skill_names, required_skill_levels, criteria_types)):
+        # Label and reasoning text indexed by criterion type, so the loop
+        # does one tuple lookup per skill instead of a branch + method call
+        labels = ('Non-Beneficial (Minimize)', 'Beneficial (Maximize)')
+        reasonings = (
+            f"< threshold {self.threshold}: Lower skill levels are acceptable",
+            f">= threshold {self.threshold}: Higher skill levels are preferred"
+        )
+
+        for name, level, ctype in zip(skill_names, required_skill_levels, criteria_types):
+            ctype = int(ctype)
             criteria_info.append({
                 'skill_name': name,
                 'required_level': float(level),
-                'criterion_type': int(ctype),
-                'criterion_type_label': 'Beneficial (Maximize)' if ctype == 1 else 'Non-Beneficial (Minimize)',
-                'reasoning': self._get_reasoning(level, ctype)
+                'criterion_type': ctype,
+                'criterion_type_label': labels[ctype],
+                'reasoning': f"Required level {level} {reasonings[ctype]}"
             })
 
         return criteria_info
@@ -182,14 +268,15 @@ class SkillTransformer:
         Returns:
             Dictionary with analysis results
         """
-        criteria_types = self.determine_criteria_types(required_skill_levels)
-        n_beneficial = np.sum(criteria_types == 1)
-        n_non_beneficial = np.sum(criteria_types == 0)
+        # Types and both tallies in one fused pass; mask indexing then
+        # partitions the names without Python loops
+        criteria_types, n_beneficial, n_non_beneficial = \
+            self.classify_and_count(required_skill_levels)
 
-        beneficial_skills = [skill_names[i] for i in range(len(skill_names))
-                            if criteria_types[i] == 1]
-        non_beneficial_skills = [skill_names[i] for i in range(len(skill_names))
-                                if criteria_types[i] == 0]
+        names = np.asarray(skill_names, dtype=object)
+        beneficial_mask = criteria_types.astype(bool)
+        beneficial_skills = names[beneficial_mask].tolist()
+        non_beneficial_skills = names[~beneficial_mask].tolist()
 
         return {
             'total_skills': len(skill_names),
@@ -264,7 +351,8 @@ class WeightGenerator:
         Returns:
             Array of uniform weights
         """
-        return np.ones(n_criteria) / n_criteria
+        # Single filled allocation instead of ones() plus a divide pass
+        return np.full(n_criteria, 1.0 / n_criteria)
 
     @staticmethod
     def importance_based_weights(
@@ -280,7 +368,8 @@ class WeightGenerator:
             Normalized weights
         """
         weights = np.array(importance_scores, dtype=float)
-        return weights / np.sum(weights)
+        np.divide(weights, weights.sum(), out=weights)
+        return weights
 
     @staticmethod
     def requirement_based_weights(
@@ -298,10 +387,11 @@ class WeightGenerator:
         Returns:
             Normalized weights
         """
-        # Weight proportional to required level
-        weights = required_levels.copy()
-        weights = np.maximum(weights, 0.1)  # Minimum weight of 0.1
-        return weights / np.sum(weights)
+        # Weight proportional to required level; np.maximum already yields a
+        # fresh float array, so clamp and normalize without extra copies
+        weights = np.maximum(required_levels, 0.1)  # Minimum weight of 0.1
+        np.divide(weights, weights.sum(), out=weights)
+        return weights
 
     @staticmethod
     def hybrid_weights(
@@ -321,7 +411,11 @@ class WeightGenerator:
             Normalized weights
         """
         req_weights = required_levels / np.sum(required_levels)
-        imp_weights = np.array(importance_scores) / np.sum(importance_scores)
-
-        hybrid = alpha * req_weights + (1 - alpha) * imp_weights
-        return hybrid / np.sum(hybrid)
+        imp_weights = np.asarray(importance_scores, dtype=float)
+
+        # Accumulate into one buffer instead of materializing both scaled
+        # terms and their sum separately
+        hybrid = req_weights * alpha
+        hybrid += imp_weights * ((1 - alpha) / imp_weights.sum())
+        hybrid /= hybrid.sum()
+        return hybrid
@@ -4,9 +4,139 @@ Adapted for profile selection based on skill levels
 Author: Combined from topsis_algorithm project
 """
 
+import logging
+import sys
+
 import numpy as np
 from typing import List, Dict, Tuple, Optional
 
+logger = logging.getLogger(__name__)
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """
+    StreamHandler that always writes to the current sys.stdout.
+
+    main.py swaps sys.stdout for a buffer on non-interactive runs, so the
+    stream must be looked up per record rather than bound at creation.
+    """
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+def _ensure_verbose_logging():
+    """
+    Make DEBUG records visible for verbose runs.
+
+    CLI entry points do not configure logging; attach a bare message-only
+    stdout handler once so verbose output looks exactly like the previous
+    print-based output. Applications that configure logging themselves are
+    left alone.
+    """
+    if not logger.handlers and not logging.getLogger().handlers:
+        handler = _StdoutHandler()
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+    if logger.getEffectiveLevel() > logging.DEBUG:
+        logger.setLevel(logging.DEBUG)
+
+
+# Try to use numba to JIT-compile the fused TOPSIS kernel (optional)
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _topsis_core(D, w, ct, distance_to_best, distance_to_worst,
+                 ideal_best, ideal_worst):
+    """
+    Fused normalize -> weight -> ideal -> distance pass over the matrix.
+
+    The step-by-step pipeline materializes the normalized and weighted
+    matrices and then sweeps them again for ideals and distances — four
+    memory-bound passes. This kernel streams the decision matrix twice
+    (column stats, then per-row distances) with no intermediate matrices.
+    Results are written into the caller-allocated output arrays, which
+    keeps the signature AOT-compilable (see _topsis_aot_build.py).
+
+    Args:
+        D: Decision matrix (alternatives x criteria)
+        w: Normalized weights
+        ct: Criteria types (1=beneficial, 0=non-beneficial)
+        distance_to_best: Output array, length n_alternatives
+        distance_to_worst: Output array, length n_alternatives
+        ideal_best: Output array, length n_criteria
+        ideal_worst: Output array, length n_criteria
+    """
+    m, n = D.shape
+    col_norm = np.empty(n)
+
+    for j in range(n):
+        s = 0.0
+        for i in range(m):
+            s += D[i, j] * D[i, j]
+        norm = np.sqrt(s)
+        if norm == 0.0:
+            norm = 1.0
+        col_norm[j] = norm
+
+        # Weighted value computed as (D / norm) * w, the exact operation
+        # order of normalize_matrix + apply_weights, so alternatives that
+        # attain a column extreme cancel to a distance of exactly 0 (the
+        # variant proximity formula branches on E+ == 0)
+        cmax = D[0, j] / norm * w[j]
+        cmin = cmax
+        for i in range(1, m):
+            v = D[i, j] / norm * w[j]
+            if v > cmax:
+                cmax = v
+            if v < cmin:
+                cmin = v
+        if ct[j] == 1:
+            ideal_best[j] = cmax
+            ideal_worst[j] = cmin
+        else:
+            ideal_best[j] = cmin
+            ideal_worst[j] = cmax
+
+    for i in range(m):
+        sb = 0.0
+        sw = 0.0
+        for j in range(n):
+            v = D[i, j] / col_norm[j] * w[j]
+            db = v - ideal_best[j]
+            dw = v - ideal_worst[j]
+            sb += db * db
+            sw += dw * dw
+        distance_to_best[i] = np.sqrt(sb)
+        distance_to_worst[i] = np.sqrt(sw)
+
+
+# Unwrapped reference kept for the AOT build script
+_topsis_core_py = _topsis_core
+
+# No fastmath: reassociation could turn the exact-zero distances that the
+# variant proximity formula branches on into tiny nonzero values
+if NUMBA_AVAILABLE:
+    _topsis_core = numba.njit(cache=True)(_topsis_core)
+
+# Prefer the AOT-compiled extension when it has been built
+# (python -m src.core._topsis_aot_build): no JIT warm-up on first call
+try:
+    from ._topsis_aot import topsis_core_f4 as _aot_core_f4
+    from ._topsis_aot import topsis_core_f8 as _aot_core_f8
+    AOT_AVAILABLE = True
+except ImportError:
+    AOT_AVAILABLE = False
+
 
 class TopsisEngine:
     """
@@ -21,7 +151,8 @@ class TopsisEngine:
         criteria_types: np.ndarray,
         alternative_names: Optional[List[str]] = None,
         criteria_names: Optional[List[str]] = None,
-        proximity_formula: str = "standard"
+        proximity_formula: str = "standard",
+        dtype=np.float32
     ):
         """
         Initialize TOPSIS engine.
@@ -33,10 +164,20 @@ class TopsisEngine:
             alternative_names: Names of alternatives (e.g., profile names)
             criteria_names: Names of criteria (e.g., skill names)
             proximity_formula: "standard" or "variant"
+            dtype: Floating dtype for all arithmetic. Skill levels are small
+                   integers, so the float32 default halves memory traffic;
+                   pass np.float64 for full double precision
         """
-        self.decision_matrix = np.array(decision_matrix, dtype=float)
-        self.weights = np.array(weights, dtype=float)
-        self.criteria_types = np.array(criteria_types, dtype=int)
+        # Column-major layout: normalization and ideal solutions reduce
+        # along axis=0, so unit-stride columns keep those reductions on
+        # sequential cache lines (the fused kernel is layout-agnostic).
+        # asfortranarray/asarray are no-ops when layout and dtype already
+        # match, so well-typed callers pay no copy here
+        self.decision_matrix = np.asfortranarray(decision_matrix, dtype=dtype)
+        # np.array (not asarray): normalization below runs in place, which
+        # must never mutate a caller-owned buffer
+        self.weights = np.array(weights, dtype=dtype)
+        self.criteria_types = np.asarray(criteria_types, dtype=int)
         self.alternative_names = alternative_names or [f"Alt_{i+1}" for i in range(len(decision_matrix))]
         self.criteria_names = criteria_names or [f"Criterion_{i+1}" for i in range(len(weights))]
         self.proximity_formula = proximity_formula
@@ -44,8 +185,12 @@ class TopsisEngine:
         # Validate inputs
         self._validate_inputs()
 
-        # Normalize weights
-        self.weights = self.weights / np.sum(self.weights)
+        # Normalize weights (in place; self.weights is our own copy)
+        self.weights /= self.weights.sum()
+
+        # Squared decision matrix, cached once: normalize_matrix reuses it
+        # for the column norms instead of re-squaring per call
+        self._D_squared = self.decision_matrix * self.decision_matrix
 
         # Results storage
         self.normalized_matrix = None
@@ -70,13 +215,14 @@ class TopsisEngine:
         if len(self.alternative_names) != n_alternatives:
             raise ValueError(f"Alternative names length ({len(self.alternative_names)}) must match number of alternatives ({n_alternatives})")
 
-        if not all(ct in [0, 1] for ct in self.criteria_types):
+        ct = self.criteria_types
+        if not ((ct == 0) | (ct == 1)).all():
             raise ValueError("Criteria types must be 0 (non-beneficial) or 1 (beneficial)")
 
-        if np.any(self.weights < 0):
+        if (self.weights < 0).any():
             raise ValueError("Weights must be non-negative")
 
-        if np.sum(self.weights) == 0:
+        if self.weights.sum() == 0:
             raise ValueError("Sum of weights cannot be zero")
 
     def normalize_matrix(self) -> np.ndarray:
@@ -87,8 +233,11 @@ class TopsisEngine:
         Returns:
             Normalized matrix
         """
+        if self.normalized_matrix is not None:
+            return self.normalized_matrix
+
         # Calculate the Euclidean norm for each criterion (column)
-        column_norms = np.sqrt(np.sum(self.decision_matrix ** 2, axis=0))
+        column_norms = np.sqrt(self._D_squared.sum(axis=0))
 
         # Avoid division by zero
         column_norms[column_norms == 0] = 1
@@ -106,6 +255,9 @@ class TopsisEngine:
         Returns:
             Weighted normalized matrix
         """
+        if self.weighted_matrix is not None:
+            return self.weighted_matrix
+
         if self.normalized_matrix is None:
             self.normalize_matrix()
 
@@ -123,19 +275,20 @@ class TopsisEngine:
         Returns:
             Tuple of (ideal_best, ideal_worst)
         """
+        if self.ideal_best is not None and self.ideal_worst is not None:
+            return self.ideal_best, self.ideal_worst
+
         if self.weighted_matrix is None:
             self.apply_weights()
 
-        self.ideal_best = np.zeros(self.weighted_matrix.shape[1])
-        self.ideal_worst = np.zeros(self.weighted_matrix.shape[1])
+        # Two whole-matrix reductions plus a branchless blend instead of
+        # per-column max/min calls dispatched from a Python loop
+        col_max = self.weighted_matrix.max(axis=0)
+        col_min = self.weighted_matrix.min(axis=0)
+        beneficial = self.criteria_types == 1
 
-        for j in range(self.weighted_matrix.shape[1]):
-            if self.criteria_types[j] == 1:  # Beneficial (maximize)
-                self.ideal_best[j] = np.max(self.weighted_matrix[:, j])
-                self.ideal_worst[j] = np.min(self.weighted_matrix[:, j])
-            else:  # Non-beneficial (minimize)
-                self.ideal_best[j] = np.min(self.weighted_matrix[:, j])
-                self.ideal_worst[j] = np.max(self.weighted_matrix[:, j])
+        self.ideal_best = np.where(beneficial, col_max, col_min)
+        self.ideal_worst = np.where(beneficial, col_min, col_max)
 
         return self.ideal_best, self.ideal_worst
 
@@ -149,16 +302,21 @@ class TopsisEngine:
         Returns:
             Tuple of (distance_to_best, distance_to_worst)
         """
+        if self.distance_to_best is not None and self.distance_to_worst is not None:
+            return self.distance_to_best, self.distance_to_worst
+
         if self.ideal_best is None or self.ideal_worst is None:
             self.determine_ideal_solutions()
 
-        # Distance to ideal best
+        # einsum fuses square + row-sum into one pass, so no diff**2
+        # temporary matrix is materialized
         diff_best = self.weighted_matrix - self.ideal_best
-        self.distance_to_best = np.sqrt(np.sum(diff_best ** 2, axis=1))
+        self.distance_to_best = np.sqrt(
+            np.einsum('ij,ij->i', diff_best, diff_best))
 
-        # Distance to ideal worst
         diff_worst = self.weighted_matrix - self.ideal_worst
-        self.distance_to_worst = np.sqrt(np.sum(diff_worst ** 2, axis=1))
+        self.distance_to_worst = np.sqrt(
+            np.einsum('ij,ij->i', diff_worst, diff_worst))
 
         return self.distance_to_best, self.distance_to_worst
 
@@ -172,56 +330,120 @@ class TopsisEngine:
         Returns:
             Proximity coefficients (higher is better)
         """
+        if self.proximity_coefficients is not None:
+            return self.proximity_coefficients
+
         if self.distance_to_best is None or self.distance_to_worst is None:
             self.calculate_distances()
 
         if self.proximity_formula == "standard":
-            # Standard TOPSIS formula
-            denominator = self.distance_to_best + self.distance_to_worst
-            # Avoid division by zero by adding a small epsilon
-            denominator[denominator == 0] = 1e-10
+            # Standard TOPSIS formula; np.maximum clamps zero denominators
+            # in one fused op instead of a mask scan plus scatter write
+            denominator = np.maximum(
+                self.distance_to_best + self.distance_to_worst, 1e-10)
             self.proximity_coefficients = self.distance_to_worst / denominator
 
         elif self.proximity_formula == "variant":
             # Variant formula: S* = E- / E+ for E+ != 0, else S* = E- / max(E+)
-            raw_proximity = np.zeros_like(self.distance_to_worst)
-            max_distance_to_best = np.max(self.distance_to_best)
-
-            for i in range(len(self.distance_to_best)):
-                if self.distance_to_best[i] != 0:
-                    raw_proximity[i] = self.distance_to_worst[i] / self.distance_to_best[i]
-                else:
-                    # When E+ = 0, use max(E+) as denominator
-                    if max_distance_to_best != 0:
-                        raw_proximity[i] = self.distance_to_worst[i] / max_distance_to_best
-                    else:
-                        # Edge case: all distances to best are 0
-                        raw_proximity[i] = 1.0
+            # (1.0 when every E+ is 0), expressed as branchless np.where
+            # blends instead of a per-element Python loop
+            max_distance_to_best = self.distance_to_best.max()
+            nonzero = self.distance_to_best != 0
+            raw_proximity = np.where(
+                nonzero,
+                self.distance_to_worst / np.where(nonzero, self.distance_to_best, 1.0),
+                (self.distance_to_worst / max_distance_to_best
+                 if max_distance_to_best != 0 else 1.0)
+            )
 
             # Normalize proximity coefficients to [0, 1] range
-            max_prox = np.max(raw_proximity)
-            if max_prox != 0:
-                self.proximity_coefficients = raw_proximity / max_prox
+            max_prox = raw_proximity.max()
+            self.proximity_coefficients = (
+                raw_proximity / max_prox if max_prox != 0 else raw_proximity)
 
         else:
             raise ValueError(f"Unknown proximity formula: {self.proximity_formula}")
 
         return self.proximity_coefficients
 
-    def get_ranking(self) -> np.ndarray:
+    def get_ranking(self, top_k: Optional[int] = None) -> np.ndarray:
         """
         Get ranking of alternatives (indices sorted by proximity, best to worst).
 
+        Args:
+            top_k: If given, return only the best top_k indices; selection
+                   uses argpartition (O(m)) plus a sort of just k elements
+                   instead of the full O(m log m) argsort
+
         Returns:
             Array of indices in ranked order
         """
         if self.proximity_coefficients is None:
             self.calculate_proximity()
 
-        self.ranking = np.argsort(self.proximity_coefficients)[::-1]
+        if top_k is not None and top_k < len(self.proximity_coefficients):
+            if self.ranking is not None:
+                return self.ranking[:top_k]
+            prox = self.proximity_coefficients
+            idx = np.argpartition(prox, -top_k)[-top_k:]
+            return idx[np.argsort(prox[idx])[::-1]]
+
+        if self.ranking is None:
+            self.ranking = np.argsort(self.proximity_coefficients)[::-1]
 
         return self.ranking
 
+    def set_weights(self, weights: np.ndarray):
+        """
+        Replace the weight vector, keeping the cached normalization.
+
+        The normalized matrix depends only on the decision matrix, so
+        sensitivity sweeps across many weight vectors pay for normalization
+        once; only the weight-dependent stages are invalidated.
+
+        Args:
+            weights: New 1D array of criterion weights
+        """
+        weights = np.asarray(weights, dtype=self.weights.dtype)
+        if len(weights) != self.decision_matrix.shape[1]:
+            raise ValueError(f"Weights length ({len(weights)}) must match number of criteria ({self.decision_matrix.shape[1]})")
+        if np.any(weights < 0):
+            raise ValueError("Weights must be non-negative")
+        if np.sum(weights) == 0:
+            raise ValueError("Sum of weights cannot be zero")
+
+        self.weights = weights / np.sum(weights)
+
+        self.weighted_matrix = None
+        self.ideal_best = None
+        self.ideal_worst = None
+        self.distance_to_best = None
+        self.distance_to_worst = None
+        self.proximity_coefficients = None
+        self.ranking = None
+
+    def set_criteria_types(self, criteria_types: np.ndarray):
+        """
+        Replace the criteria types, invalidating from the ideal solutions on.
+
+        Args:
+            criteria_types: New 1D array (1=beneficial, 0=non-beneficial)
+        """
+        criteria_types = np.array(criteria_types, dtype=int)
+        if len(criteria_types) != self.decision_matrix.shape[1]:
+            raise ValueError(f"Criteria types length ({len(criteria_types)}) must match number of criteria ({self.decision_matrix.shape[1]})")
+        if not np.all((criteria_types == 0) | (criteria_types == 1)):
+            raise ValueError("Criteria types must be 0 (non-beneficial) or 1 (beneficial)")
+
+        self.criteria_types = criteria_types
+
+        self.ideal_best = None
+        self.ideal_worst = None
+        self.distance_to_best = None
+        self.distance_to_worst = None
+        self.proximity_coefficients = None
+        self.ranking = None
+
     def calculate(self, verbose: bool = False) -> np.ndarray:
         """
         Execute complete TOPSIS algorithm.
@@ -232,57 +454,155 @@ class TopsisEngine:
         Returns:
             Proximity coefficients
         """
+        # Verbose output goes through the module logger: stringifying the
+        # intermediate matrices is deferred until a handler actually emits,
+        # and applications can redirect or silence it via logging config
         if verbose:
-            print("="*80)
-            print("TOPSIS Algorithm - Profile Selection")
-            print("="*80)
-            print(f"\nAlternatives: {len(self.alternative_names)}")
-            print(f"Criteria: {len(self.criteria_names)}")
-            print(f"Proximity Formula: {self.proximity_formula}")
-
-        # Step 1: Normalize
-        self.normalize_matrix()
-        if verbose:
-            print("\nStep 1: Normalized Matrix")
-            print(self.normalized_matrix)
+            _ensure_verbose_logging()
+        debug = verbose and logger.isEnabledFor(logging.DEBUG)
+
+        if debug:
+            logger.debug("="*80)
+            logger.debug("TOPSIS Algorithm - Profile Selection")
+            logger.debug("="*80)
+            logger.debug("\nAlternatives: %d", len(self.alternative_names))
+            logger.debug("Criteria: %d", len(self.criteria_names))
+            logger.debug("Proximity Formula: %s", self.proximity_formula)
+
+        if (AOT_AVAILABLE or NUMBA_AVAILABLE) and not verbose:
+            # Fast path: fused compiled kernel runs steps 1-4 in one call
+            # without materializing the intermediate matrices (only needed
+            # for the verbose step-by-step printout); skipped entirely when
+            # the distances from a previous run are still valid
+            if self.distance_to_best is None:
+                m, n = self.decision_matrix.shape
+                dtype = self.decision_matrix.dtype
+                self.distance_to_best = np.empty(m, dtype=dtype)
+                self.distance_to_worst = np.empty(m, dtype=dtype)
+                self.ideal_best = np.empty(n, dtype=dtype)
+                self.ideal_worst = np.empty(n, dtype=dtype)
+
+                if AOT_AVAILABLE and dtype == np.float32:
+                    kernel = _aot_core_f4
+                elif AOT_AVAILABLE and dtype == np.float64:
+                    kernel = _aot_core_f8
+                else:
+                    kernel = _topsis_core
+                kernel(self.decision_matrix, self.weights,
+                       self.criteria_types,
+                       self.distance_to_best, self.distance_to_worst,
+                       self.ideal_best, self.ideal_worst)
+        else:
+            # Step 1: Normalize
+            self.normalize_matrix()
+            if debug:
+                logger.debug("\nStep 1: Normalized Matrix")
+                logger.debug("%s", self.normalized_matrix)
 
-        # Step 2: Apply weights
-        self.apply_weights()
-        if verbose:
-            print("\nStep 2: Weighted Normalized Matrix")
-            print(self.weighted_matrix)
+            # Step 2: Apply weights
+            self.apply_weights()
+            if debug:
+                logger.debug("\nStep 2: Weighted Normalized Matrix")
+                logger.debug("%s", self.weighted_matrix)
 
-        # Step 3: Ideal solutions
-        self.determine_ideal_solutions()
-        if verbose:
-            print("\nStep 3: Ideal Solutions")
-            print(f"Ideal Best (A+): {self.ideal_best}")
-            print(f"Ideal Worst (A-): {self.ideal_worst}")
+            # Step 3: Ideal solutions
+            self.determine_ideal_solutions()
+            if debug:
+                logger.debug("\nStep 3: Ideal Solutions")
+                logger.debug("Ideal Best (A+): %s", self.ideal_best)
+                logger.debug("Ideal Worst (A-): %s", self.ideal_worst)
 
-        # Step 4: Calculate distances
-        self.calculate_distances()
-        if verbose:
-            print("\nStep 4: Euclidean Distances")
-            print(f"Distance to Best (E+): {self.distance_to_best}")
-            print(f"Distance to Worst (E-): {self.distance_to_worst}")
+            # Step 4: Calculate distances
+            self.calculate_distances()
+            if debug:
+                logger.debug("\nStep 4: Euclidean Distances")
+                logger.debug("Distance to Best (E+): %s", self.distance_to_best)
+                logger.debug("Distance to Worst (E-): %s", self.distance_to_worst)
 
         # Step 5: Proximity coefficients
         self.calculate_proximity()
-        if verbose:
-            print("\nStep 5: Proximity Coefficients")
-            print(f"Coefficients: {self.proximity_coefficients}")
+        if debug:
+            logger.debug("\nStep 5: Proximity Coefficients")
+            logger.debug("Coefficients: %s", self.proximity_coefficients)
 
         # Get ranking
         self.get_ranking()
-        if verbose:
-            print("\n" + "="*80)
-            print("RESULTS - Ranked Alternatives")
-            print("="*80)
+        if debug:
+            logger.debug("\n" + "="*80)
+            logger.debug("RESULTS - Ranked Alternatives")
+            logger.debug("="*80)
             for i, idx in enumerate(self.ranking):
-                print(f"{i+1}. {self.alternative_names[idx]}: {self.proximity_coefficients[idx]:.6f} ({self.proximity_coefficients[idx]*100:.2f}%)")
+                logger.debug("%d. %s: %.6f (%.2f%%)",
+                             i + 1, self.alternative_names[idx],
+                             self.proximity_coefficients[idx],
+                             self.proximity_coefficients[idx] * 100)
 
         return self.proximity_coefficients
 
+    def calculate_batch(self, weights_batch: np.ndarray) -> np.ndarray:
+        """
+        Compute proximity coefficients for many weight vectors in one pass.
+
+        Sensitivity sweeps and Monte Carlo weight sampling otherwise
+        instantiate the engine per vector, redoing normalization each time.
+        Here the matrix is normalized once and all K weightings are applied
+        through a single 3-D broadcast, like the batched activity pipeline.
+
+        Args:
+            weights_batch: 2D array (K x n_criteria), one weight vector per
+                           row; each row is normalized to sum to 1
+
+        Returns:
+            2D array (K x n_alternatives) of proximity coefficients
+        """
+        W = np.asarray(weights_batch, dtype=self.decision_matrix.dtype)
+        if W.ndim != 2 or W.shape[1] != self.decision_matrix.shape[1]:
+            raise ValueError(f"weights_batch must have shape (K, {self.decision_matrix.shape[1]})")
+        if np.any(W < 0):
+            raise ValueError("Weights must be non-negative")
+        row_sums = W.sum(axis=1, keepdims=True)
+        if np.any(row_sums == 0):
+            raise ValueError("Sum of weights cannot be zero")
+        W = W / row_sums
+
+        # Weighted matrices for all K vectors: (K, n_alternatives, n_criteria)
+        R = self.normalize_matrix()
+        V = R[None, :, :] * W[:, None, :]
+
+        # Ideal solutions per weight vector, blended on the beneficial mask
+        v_max = V.max(axis=1)
+        v_min = V.min(axis=1)
+        beneficial = self.criteria_types == 1
+        ideal_best = np.where(beneficial, v_max, v_min)
+        ideal_worst = np.where(beneficial, v_min, v_max)
+
+        # Euclidean distances, (K, n_alternatives); einsum avoids diff**2
+        # temporaries as in calculate_distances
+        diff_best = V - ideal_best[:, None, :]
+        diff_worst = V - ideal_worst[:, None, :]
+        d_best = np.sqrt(np.einsum('kij,kij->ki', diff_best, diff_best))
+        d_worst = np.sqrt(np.einsum('kij,kij->ki', diff_worst, diff_worst))
+
+        # Proximity, row-wise application of the scalar formulas
+        if self.proximity_formula == "standard":
+            proximity = d_worst / np.maximum(d_best + d_worst, 1e-10)
+        elif self.proximity_formula == "variant":
+            max_d_best = d_best.max(axis=1, keepdims=True)
+            fallback = np.where(max_d_best != 0, max_d_best, 1.0)
+            raw = np.where(
+                d_best != 0,
+                d_worst / np.where(d_best != 0, d_best, 1.0),
+                np.where(max_d_best != 0,
+                         d_worst / np.broadcast_to(fallback, d_worst.shape),
+                         1.0)
+            )
+            max_prox = raw.max(axis=1, keepdims=True)
+            proximity = raw / np.where(max_prox != 0, max_prox, 1.0)
+        else:
+            raise ValueError(f"Unknown proximity formula: {self.proximity_formula}")
+
+        return proximity
+
     def get_results_dict(self) -> Dict:
         """
         Get complete results as a dictionary.
@@ -4,13 +4,66 @@ Generate charts and graphs for TOPSIS profile selection results
 Author: Abdel YEZZA (Ph.D)
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
+import atexit
 import numpy as np
+import os
 import pandas as pd
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional
-import seaborn as sns
+
+# matplotlib and seaborn account for most of this module's import time, so
+# they are loaded on first visualizer construction; importing charts (e.g.
+# from test scripts that may never plot) stays cheap
+plt = None
+mpatches = None
+sns = None
+
+
+def _import_plotting():
+    """Load matplotlib/seaborn into the module globals on first use."""
+    global plt, mpatches, sns
+    if plt is not None:
+        return
+    import matplotlib
+    # Force the non-interactive Agg backend: all output goes to files, and
+    # Agg avoids the GUI-toolkit overhead per figure. Note that with Agg
+    # the plt.show() branches (save=False) render nothing on screen.
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt_mod
+    import matplotlib.patches as mpatches_mod
+    import seaborn as sns_mod
+    plt = plt_mod
+    mpatches = mpatches_mod
+    sns = sns_mod
+
+
+# Per-process state for parallel chart rendering; each worker process gets
+# its own visualizer (and therefore its own matplotlib state) so nothing
+# is shared across processes.
+_worker_visualizer = None
+_worker_profiles_df = None
+
+
+def _init_render_worker(output_dir, dpi, style, profiles_df):
+    """Create the per-process visualizer used by _render_activity."""
+    global _worker_visualizer, _worker_profiles_df
+    _worker_visualizer = ProfileVisualizer(output_dir, dpi=dpi, style=style)
+    _worker_profiles_df = profiles_df
+
+
+def _render_activity(task):
+    """Render the three charts for one activity in a worker process."""
+    activity_name, results, top_n, proximity_formula = task
+    paths = _worker_visualizer._render_activity_charts(
+        activity_name, results, _worker_profiles_df, top_n, proximity_formula
+    )
+    # Worker processes may exit without running atexit hooks, so make sure
+    # queued saves are on disk before reporting the task done
+    _worker_visualizer.flush()
+    return paths
 
 
 class ProfileVisualizer:
@@ -18,7 +71,13 @@ class ProfileVisualizer:
     Create visualizations for TOPSIS profile selection results.
     """
 
-    def __init__(self, output_dir: Path, dpi: int = 300, style: str = 'seaborn-v0_8-darkgrid'):
+    def __init__(
+        self,
+        output_dir: Path,
+        dpi: int = 300,
+        style: str = 'seaborn-v0_8-darkgrid',
+        max_annot_cells: int = 400
+    ):
         """
         Initialize visualizer.
 
@@ -26,10 +85,20 @@ class ProfileVisualizer:
             output_dir: Directory to save figures
             dpi: Resolution for saved figures
             style: Matplotlib style
+            max_annot_cells: Skip heatmap cell annotations above this many
+                cells (they are unreadable and cost one Text artist each)
         """
+        _import_plotting()
+
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # PNG encode cost grows with pixel count, so batch runs can choose
+        # between a cheap screen-resolution preview and full publish quality
+        self.preview_dpi = 96
+        self.publish_dpi = dpi
         self.dpi = dpi
+        self.style = style
+        self.max_annot_cells = max_annot_cells
 
         # Set style
         try:
@@ -37,8 +106,109 @@ class ProfileVisualizer:
         except:
             plt.style.use('default')
 
-        # Set color palette
+        # Set color palette; the ndarray copy lets matplotlib's color
+        # converter short-circuit on numeric RGB rows instead of converting
+        # a fresh list slice on every call
         self.colors = sns.color_palette("husl", 15)
+        self._colors_arr = np.asarray(self.colors, dtype=np.float32)
+
+        # Heatmap annotation arrays memoized on the score buffer, so
+        # re-plotting the same results (e.g. with another cmap or dpi)
+        # skips the string formatting pass
+        self._annot_cache = {}
+
+        # Cached figures reused across per-activity plots (see _reuse_axes)
+        self._fig_cache = {}
+        self._fig_locks = {}
+
+        # Background PNG writer: per-activity savefig calls are queued so
+        # encoding and disk I/O overlap the drawing of the next chart
+        self._io_queue = None
+        self._io_thread = None
+        self._io_error = None
+
+    def _reuse_axes(self, key: str, **subplots_kwargs):
+        """
+        Return a cached (fig, ax) pair for the given key, creating it on
+        first use.
+
+        Axes creation is one of matplotlib's most expensive operations, and
+        the per-activity charts pay it three times per activity. Clearing and
+        redrawing a cached Axes is far cheaper, so figures are kept open
+        between calls and only closed by close_figures().
+
+        Args:
+            key: Cache key identifying the chart type
+            **subplots_kwargs: Arguments for plt.subplots on first creation
+
+        Returns:
+            Tuple of (figure, cleared axes)
+        """
+        if key not in self._fig_cache:
+            self._fig_cache[key] = plt.subplots(**subplots_kwargs)
+            self._fig_locks[key] = threading.Lock()
+        # Wait until any queued save of this figure has finished before the
+        # axes are cleared; the writer thread releases the lock after savefig
+        self._fig_locks[key].acquire()
+        fig, ax = self._fig_cache[key]
+        ax.clear()
+        return fig, ax
+
+    def _save_async(self, fig, filename: Path, key: str) -> Path:
+        """
+        Queue a cached figure for saving on the background writer thread.
+
+        savefig both encodes the PNG and writes it to disk; doing that on a
+        worker thread lets the main thread start drawing the next chart
+        immediately. The per-figure lock taken in _reuse_axes is released by
+        the writer once the figure is safely on disk.
+
+        Args:
+            fig: Figure to save
+            filename: Destination path
+            key: Figure-cache key whose lock the writer should release
+
+        Returns:
+            The destination path
+        """
+        if self._io_thread is None:
+            self._io_queue = queue.Queue(maxsize=4)
+            self._io_thread = threading.Thread(target=self._writer_loop, daemon=True)
+            self._io_thread.start()
+            # Daemon thread: make sure queued saves land even if a caller
+            # never reaches flush()
+            atexit.register(self.flush)
+        self._io_queue.put((fig, filename, key))
+        return filename
+
+    def _writer_loop(self):
+        """Consume queued (figure, path, key) tuples and write the PNGs."""
+        while True:
+            fig, filename, key = self._io_queue.get()
+            try:
+                fig.savefig(filename, dpi=self.dpi, bbox_inches='tight')
+            except Exception as exc:
+                if self._io_error is None:
+                    self._io_error = exc
+            finally:
+                self._fig_locks[key].release()
+                self._io_queue.task_done()
+
+    def flush(self):
+        """Wait until all queued figure saves have been written to disk."""
+        if self._io_queue is not None:
+            self._io_queue.join()
+        if self._io_error is not None:
+            error, self._io_error = self._io_error, None
+            raise error
+
+    def close_figures(self):
+        """Finish pending saves, then close all cached figures."""
+        self.flush()
+        for fig, _ in self._fig_cache.values():
+            plt.close(fig)
+        self._fig_cache.clear()
+        self._fig_locks.clear()
 
     def plot_ranking_bar_chart(
         self,
@@ -65,61 +235,85 @@ class ProfileVisualizer:
         profiles = [r['alternative'] for r in ranked_results]
         coefficients = [r['coefficient'] for r in ranked_results]
 
-        fig, ax = plt.subplots(figsize=(12, 6))
+        fig, ax = self._reuse_axes('ranking_bar', figsize=(12, 6),
+                                   constrained_layout=True)
 
-        bars = ax.barh(profiles, coefficients, color=self.colors[:len(profiles)])
+        bars = ax.barh(profiles, coefficients, color=self._colors_arr[:len(profiles)])
 
         ax.set_xlabel('Proximity Coefficient', fontsize=12, fontweight='bold')
         ax.set_ylabel('Profile', fontsize=12, fontweight='bold')
         ax.set_title(f'TOPSIS Ranking: {activity_name}\nTop {top_n} Profiles-Method: ' + proximity_formula,
                     fontsize=14, fontweight='bold')
 
-        # Add value labels on bars
-        for i, (bar, coef) in enumerate(zip(bars, coefficients)):
-            ax.text(coef + 0.01, bar.get_y() + bar.get_height()/2,
-                   f'{coef:.4f}',
-                   va='center', fontsize=9)
+        # Add value labels on bars in one batched call instead of one
+        # ax.text per bar
+        ax.bar_label(bars, labels=[f'{coef:.4f}' for coef in coefficients],
+                     padding=3, fontsize=9)
 
         ax.set_xlim(0, 1.0)
         ax.grid(axis='x', alpha=0.3)
-        plt.tight_layout()
 
         if save:
             safe_name = activity_name.replace(' ', '_').replace('/', '_')
             filename = self.output_dir / f'ranking_bar_{safe_name}.png'
-            plt.savefig(filename, dpi=self.dpi, bbox_inches='tight')
-            plt.close()
-            return filename
+            return self._save_async(fig, filename, 'ranking_bar')
         else:
+            self._fig_locks['ranking_bar'].release()
             plt.show()
             return None
 
-    def plot_comparison_heatmap(
+    def _build_heatmap_figure(
         self,
         full_results_df: pd.DataFrame,
-        proximity_formula: str = 'add topsis method',
-        save: bool = True
-    ) -> Optional[Path]:
+        proximity_formula: str = 'add topsis method'
+    ):
         """
-        Create heatmap showing all profiles vs all activities.
+        Build the comparison heatmap figure without saving it.
+
+        Factored out of plot_comparison_heatmap so callers that save several
+        variants of the same heatmap (e.g. the font-size demo) can restyle
+        and re-save one rendered figure instead of re-running the seaborn
+        layout per variant.
 
         Args:
             full_results_df: DataFrame with activities as index, profiles as columns
-            save: If True, save figure
+            proximity_formula: Formula label for the title
 
         Returns:
-            Path to saved figure if save=True, else None
+            Tuple (fig, ax) holding the rendered heatmap
         """
 
-        # Add ranking annotations
-        full_results_df_ranked = full_results_df.rank(ascending=False, axis=1, method='min').astype(int)
-        annot_df = full_results_df.round(3).astype(str) + '\n(#' + full_results_df_ranked.astype(str) + ')'
+        # float32 halves the memory traffic of seaborn's normalize/QuadMesh
+        # pass; coefficients sit in [0, 1] so the precision is ample
+        full_results_df = full_results_df.astype(np.float32, copy=False)
+
+        # Add ranking annotations, built with fixed-width NumPy string ops
+        # rather than element-wise object concatenation. Above
+        # max_annot_cells the labels are unreadable anyway, so skip them and
+        # save one Text artist per cell.
+        vals = full_results_df.to_numpy()
+        if vals.size <= self.max_annot_cells:
+            key = hash(vals.tobytes())
+            annot = self._annot_cache.get(key)
+            if annot is None:
+                ranks = full_results_df.rank(
+                    ascending=False, axis=1, method='min'
+                ).to_numpy(dtype=np.int64)
+                annot = np.char.add(
+                    np.char.add(np.round(vals, 3).astype('U8'), '\n(#'),
+                    np.char.add(ranks.astype('U4'), ')')
+                )
+                if len(self._annot_cache) >= 8:
+                    self._annot_cache.clear()
+                self._annot_cache[key] = annot
+        else:
+            annot = None
 
-        fig, ax = plt.subplots(figsize=(16, 10))
+        fig, ax = plt.subplots(figsize=(16, 10), constrained_layout=True)
 
         sns.heatmap(
             full_results_df,
-            annot=annot_df,
+            annot=annot,
             fmt='',
             cmap='YlGnBu',
             cbar_kws={'label': 'Proximity Coefficient'},
@@ -128,6 +322,11 @@ class ProfileVisualizer:
             linewidths=0.5
         )
 
+        # Rasterize the cell mesh: it dominates render time and output size
+        # on large matrices, while text/labels stay vectorized for crispness
+        # if the output format is ever switched to PDF/SVG
+        ax.collections[0].set_rasterized(True)
+
         ax.set_title('TOPSIS Results Heatmap-Method: ' + proximity_formula + '\nProfiles vs Activities',
                     fontsize=16, fontweight='bold', pad=20)
         ax.set_xlabel('Profile', fontsize=12, fontweight='bold')
@@ -135,12 +334,31 @@ class ProfileVisualizer:
 
         plt.xticks(rotation=45, ha='right')
         plt.yticks(rotation=0)
-        plt.tight_layout()
+
+        return fig, ax
+
+    def plot_comparison_heatmap(
+        self,
+        full_results_df: pd.DataFrame,
+        proximity_formula: str = 'add topsis method',
+        save: bool = True
+    ) -> Optional[Path]:
+        """
+        Create heatmap showing all profiles vs all activities.
+
+        Args:
+            full_results_df: DataFrame with activities as index, profiles as columns
+            save: If True, save figure
+
+        Returns:
+            Path to saved figure if save=True, else None
+        """
+        fig, ax = self._build_heatmap_figure(full_results_df, proximity_formula)
 
         if save:
             filename = self.output_dir / 'heatmap_all_results.png'
-            plt.savefig(filename, dpi=self.dpi, bbox_inches='tight')
-            plt.close()
+            fig.savefig(filename, dpi=self.dpi, bbox_inches='tight')
+            plt.close(fig)
             return filename
         else:
             plt.show()
@@ -166,26 +384,47 @@ class ProfileVisualizer:
         Returns:
             Path to saved figure if save=True, else None
         """
-        # Get data for selected profiles
-        selected_profiles = profiles_df.loc[profile_names]
+        from matplotlib.collections import LineCollection, PolyCollection
+        from matplotlib.lines import Line2D
+
+        # Get data for selected profiles: one label lookup and ndarray
+        # conversion up front, no pandas indexing in the per-profile loop
+        values_matrix = profiles_df.loc[profile_names].to_numpy()
 
         # Skill names
         skills = list(profiles_df.columns)
         n_skills = len(skills)
 
         # Compute angle for each skill
-        angles = np.linspace(0, 2 * np.pi, n_skills, endpoint=False).tolist()
-        angles += angles[:1]  # Complete the circle
-
-        fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(projection='polar'))
-
-        for i, profile_name in enumerate(profile_names):
-            values = selected_profiles.loc[profile_name].tolist()
-            values += values[:1]  # Complete the circle
-
-            ax.plot(angles, values, 'o-', linewidth=2,
-                   label=profile_name, color=self.colors[i])
-            ax.fill(angles, values, alpha=0.15, color=self.colors[i])
+        angles = np.linspace(0, 2 * np.pi, n_skills, endpoint=False)
+        angles = np.concatenate([angles, angles[:1]])  # Complete the circle
+
+        fig, ax = self._reuse_axes('radar', figsize=(10, 10),
+                                   subplot_kw=dict(projection='polar'),
+                                   constrained_layout=True)
+
+        # One composite outline artist and one fill artist for all profiles,
+        # instead of a Line2D plus polygon per profile; markers go into a
+        # single scatter call
+        # Complete the circle for every profile in one concatenate
+        closed = np.concatenate([values_matrix, values_matrix[:, :1]], axis=1)
+        verts = [np.column_stack([angles, closed[i]])
+                 for i in range(len(profile_names))]
+
+        colors = self._colors_arr[:len(verts)]
+        ax.add_collection(PolyCollection(verts, facecolors=colors, alpha=0.15))
+        ax.add_collection(LineCollection(verts, colors=colors, linewidths=2))
+        points = np.concatenate(verts)
+        ax.scatter(points[:, 0], points[:, 1],
+                   c=np.repeat(colors, len(angles), axis=0), s=36, zorder=3)
+
+        # Proxy handles: the composite artists cannot serve as per-profile
+        # legend entries
+        legend_handles = [
+            Line2D([0], [0], color=colors[i], marker='o', linewidth=2,
+                   label=profile_name)
+            for i, profile_name in enumerate(profile_names)
+        ]
 
         # Set labels
         ax.set_xticks(angles[:-1])
@@ -198,16 +437,15 @@ class ProfileVisualizer:
         ax.set_title(f'Skill Comparison - {activity_name}\nTop Profiles-Method: ' + proximity_formula,
                     fontsize=14, fontweight='bold', pad=20)
 
-        plt.legend(loc='upper right', bbox_to_anchor=(1.3, 1.1))
-        plt.tight_layout()
+        ax.legend(handles=legend_handles, loc='upper right',
+                  bbox_to_anchor=(1.3, 1.1))
 
         if save:
             safe_name = activity_name.replace(' ', '_').replace('/', '_')
             filename = self.output_dir / f'radar_{safe_name}.png'
-            plt.savefig(filename, dpi=self.dpi, bbox_inches='tight')
-            plt.close()
-            return filename
+            return self._save_async(fig, filename, 'radar')
         else:
+            self._fig_locks['radar'].release()
             plt.show()
             return None
 
@@ -240,7 +478,8 @@ class ProfileVisualizer:
         x = np.arange(len(profiles))
         width = 0.35
 
-        fig, ax = plt.subplots(figsize=(14, 6))
+        fig, ax = self._reuse_axes('distances', figsize=(14, 6),
+                                   constrained_layout=True)
 
         bars1 = ax.bar(x - width/2, dist_best, width, label='Distance to Best (E+)',
                       color='coral', alpha=0.8)
@@ -256,15 +495,12 @@ class ProfileVisualizer:
         ax.legend()
         ax.grid(axis='y', alpha=0.3)
 
-        plt.tight_layout()
-
         if save:
             safe_name = activity_name.replace(' ', '_').replace('/', '_')
             filename = self.output_dir / f'distances_{safe_name}.png'
-            plt.savefig(filename, dpi=self.dpi, bbox_inches='tight')
-            plt.close()
-            return filename
+            return self._save_async(fig, filename, 'distances')
         else:
+            self._fig_locks['distances'].release()
             plt.show()
             return None
 
@@ -286,22 +522,18 @@ class ProfileVisualizer:
         Returns:
             Path to saved figure if save=True, else None
         """
-        beneficial_counts = []
-        non_beneficial_counts = []
-
-        for activity_name in activities_df.index:
-            required_skills = activities_df.loc[activity_name].values
-            n_beneficial = np.sum(required_skills >= threshold)
-            n_non_beneficial = np.sum(required_skills < threshold)
-
-            beneficial_counts.append(n_beneficial)
-            non_beneficial_counts.append(n_non_beneficial)
+        # One vectorized comparison over the whole requirements matrix
+        # instead of a per-activity Python loop; float32 is exact for
+        # skill levels
+        required = activities_df.to_numpy(dtype=np.float32)
+        beneficial_counts = (required >= threshold).sum(axis=1)
+        non_beneficial_counts = required.shape[1] - beneficial_counts
 
         activities = activities_df.index.tolist()
         x = np.arange(len(activities))
         width = 0.35
 
-        fig, ax = plt.subplots(figsize=(14, 6))
+        fig, ax = plt.subplots(figsize=(14, 6), constrained_layout=True)
 
         bars1 = ax.bar(x - width/2, beneficial_counts, width,
                       label=f'Beneficial (>= {threshold})',
@@ -319,8 +551,6 @@ class ProfileVisualizer:
         ax.legend()
         ax.grid(axis='y', alpha=0.3)
 
-        plt.tight_layout()
-
         if save:
             filename = self.output_dir / 'criteria_distribution.png'
             plt.savefig(filename, dpi=self.dpi, bbox_inches='tight')
@@ -330,6 +560,66 @@ class ProfileVisualizer:
             plt.show()
             return None
 
+    def _render_table_image(
+        self,
+        headers: List[str],
+        table_data: List[List[str]],
+        col_widths: List[float],
+        px_width: int = 3600,
+        row_height: int = 96,
+        fontsize: int = 34
+    ) -> np.ndarray:
+        """
+        Render a styled table (green header, zebra rows) as one RGB image.
+
+        Args:
+            headers: Column header labels
+            table_data: Table rows as lists of cell strings
+            col_widths: Relative column widths
+            px_width: Total image width in pixels
+            row_height: Row height in pixels
+            fontsize: Cell font size in pixels
+
+        Returns:
+            Image as an (H, W, 3) uint8 array suitable for ax.imshow
+        """
+        from matplotlib import font_manager
+        from PIL import Image, ImageDraw, ImageFont
+
+        font = ImageFont.truetype(font_manager.findfont('DejaVu Sans'), fontsize)
+        bold = ImageFont.truetype(
+            font_manager.findfont(font_manager.FontProperties(weight='bold')),
+            fontsize
+        )
+
+        total = sum(col_widths)
+        widths = [int(px_width * w / total) for w in col_widths]
+        n_rows = len(table_data) + 1
+        img = Image.new('RGB', (sum(widths), row_height * n_rows), 'white')
+        draw = ImageDraw.Draw(img)
+
+        for r in range(n_rows):
+            y = r * row_height
+            if r == 0:
+                cells, fill, text_fill, row_font = headers, '#4CAF50', 'white', bold
+            else:
+                cells = table_data[r - 1]
+                fill = '#f0f0f0' if r % 2 == 0 else 'white'
+                text_fill, row_font = 'black', font
+            x = 0
+            for text, w in zip(cells, widths):
+                draw.rectangle([x, y, x + w, y + row_height],
+                               fill=fill, outline='black')
+                if r == 0:
+                    draw.text((x + w // 2, y + row_height // 2), str(text),
+                              fill=text_fill, font=row_font, anchor='mm')
+                else:
+                    draw.text((x + fontsize // 2, y + row_height // 2), str(text),
+                              fill=text_fill, font=row_font, anchor='lm')
+                x += w
+
+        return np.asarray(img)
+
     def plot_ranking_overview(
         self,
         ranking_matrix_df: pd.DataFrame,
@@ -346,17 +636,13 @@ class ProfileVisualizer:
         Returns:
             Path to saved figure if save=True, else None
         """
-        fig, ax = plt.subplots(figsize=(14, 8))
+        fig, ax = plt.subplots(figsize=(14, 8), constrained_layout=True)
 
         # Extract data for visualization
         activities = ranking_matrix_df['Activity'].tolist()
         n_activities = len(activities)
         n_ranks = len([col for col in ranking_matrix_df.columns if col.startswith('Rank')])
 
-        # Create text table
-        ax.axis('tight')
-        ax.axis('off')
-
         table_data = []
         for _, row in ranking_matrix_df.iterrows():
             row_data = [row['Activity']]
@@ -370,38 +656,18 @@ class ProfileVisualizer:
 
         headers = ['Activity'] + [f'Rank {i}' for i in range(1, n_ranks + 1)]
 
-        table = ax.table(
-            cellText=table_data,
-            colLabels=headers,
-            cellLoc='left',
-            loc='center',
-            colWidths=[0.2] + [0.27] * n_ranks
+        # Render the table as a single image artist; ax.table builds one
+        # Rectangle and one Text artist per cell, which dominates render
+        # time once there are many activities
+        img = self._render_table_image(
+            headers, table_data, [0.2] + [0.27] * n_ranks
         )
-
-        table.auto_set_font_size(False)
-        table.set_fontsize(9)
-        table.scale(1, 2)
-
-        # Style header
-        for i in range(len(headers)):
-            cell = table[(0, i)]
-            cell.set_facecolor('#4CAF50')
-            cell.set_text_props(weight='bold', color='white')
-
-        # Alternate row colors
-        for i in range(1, len(table_data) + 1):
-            for j in range(len(headers)):
-                cell = table[(i, j)]
-                if i % 2 == 0:
-                    cell.set_facecolor('#f0f0f0')
-                else:
-                    cell.set_facecolor('white')
+        ax.imshow(img)
+        ax.axis('off')
 
         ax.set_title('TOPSIS Profile Selection - Ranking Overview\nTop Profiles per Activity-Method: ' + proximity_formula,
                     fontsize=16, fontweight='bold', pad=20)
 
-        plt.tight_layout()
-
         if save:
             filename = self.output_dir / 'ranking_overview.png'
             plt.savefig(filename, dpi=self.dpi, bbox_inches='tight')
@@ -432,7 +698,7 @@ class ProfileVisualizer:
         Returns:
             Path to saved figure if save=True, else None
         """
-        fig, ax = plt.subplots(figsize=(18, 12))
+        fig, ax = plt.subplots(figsize=(18, 12), constrained_layout=True)
 
         # Create annotation matrix with scores and assignment markers
         annot_array = np.empty(full_results_df.shape, dtype=object)
@@ -500,7 +766,6 @@ class ProfileVisualizer:
 
         plt.xticks(rotation=45, ha='right')
         plt.yticks(rotation=0)
-        plt.tight_layout()
 
         if save:
             filename = self.output_dir / 'optimal_heatmap_all_results.png'
@@ -512,10 +777,61 @@ class ProfileVisualizer:
             plt.show()
             return None
 
+    def _render_activity_charts(
+        self,
+        activity_name: str,
+        results: Dict,
+        profiles_df: pd.DataFrame,
+        top_n: int,
+        proximity_formula: str
+    ) -> List[Path]:
+        """
+        Render the bar, distance and radar charts for one activity.
+
+        Args:
+            activity_name: Name of the activity
+            results: Results dictionary from ProfileProcessor
+            profiles_df: DataFrame with profile skills
+            top_n: Number of top profiles to display
+            proximity_formula: TOPSIS method name
+
+        Returns:
+            List of paths to the saved figures
+        """
+        saved_files = []
+
+        file_path = self.plot_ranking_bar_chart(
+            results, activity_name, top_n=top_n,
+            proximity_formula=proximity_formula, save=True
+        )
+        if file_path:
+            saved_files.append(file_path)
+
+        file_path = self.plot_distance_comparison(
+            results, activity_name, top_n=top_n,
+            proximity_formula=proximity_formula, save=True
+        )
+        if file_path:
+            saved_files.append(file_path)
+
+        top_profiles = [r['alternative'] for r in results['ranked_results'][:5]]
+        file_path = self.plot_radar_chart(
+            profiles_df,
+            top_profiles,
+            activity_name,
+            proximity_formula,
+            save=True
+        )
+        if file_path:
+            saved_files.append(file_path)
+
+        return saved_files
+
     def generate_all_visualizations(
         self,
         processor,
-        top_n: int = 10
+        top_n: int = 10,
+        quality: str = 'publish'
     ) -> List[Path]:
         """
         Generate all visualizations for the processed results.
@@ -523,10 +839,16 @@ class ProfileVisualizer:
         Args:
             processor: ProfileProcessor instance with results
             top_n: Number of top profiles for individual charts
+            quality: 'publish' for full-resolution output, 'preview' for
+                fast screen-resolution PNGs
 
         Returns:
             List of paths to generated figures
         """
+        if quality not in ('preview', 'publish'):
+            raise ValueError(f"Unknown quality: {quality}")
+        self.dpi = self.preview_dpi if quality == 'preview' else self.publish_dpi
+
         saved_files = []
 
         print("\n  Generating visualizations...")
@@ -557,30 +879,34 @@ class ProfileVisualizer:
             saved_files.append(file_path)
 
         # 4. Individual activity charts (bar, distance, radar)
-        for i, (activity_name, results) in enumerate(processor.results.items()):
-            print(f"    - Creating charts for activity {i+1}/{len(processor.results)}: {activity_name}")
-
-            # Bar chart
-            file_path = self.plot_ranking_bar_chart(results, activity_name, top_n=top_n, proximity_formula=processor.proximity_formula, save=True)
-            if file_path:
-                saved_files.append(file_path)
-
-            # Distance comparison
-            file_path = self.plot_distance_comparison(results, activity_name, top_n=top_n, proximity_formula=processor.proximity_formula,save=True)
-            if file_path:
-                saved_files.append(file_path)
-
-            # Radar chart for top 5
-            top_profiles = [r['alternative'] for r in results['ranked_results'][:5]]
-            file_path = self.plot_radar_chart(
-                processor.profiles_df,
-                top_profiles,
-                activity_name,
-                processor.proximity_formula,
-                save=True
-            )
-            if file_path:
-                saved_files.append(file_path)
+        # Each activity's charts are independent and write distinct files, so
+        # they can render in parallel worker processes (Agg is process-safe).
+        # On a single core the pool would only add process start-up and
+        # pickling cost, so fall back to the in-process loop.
+        n_workers = min(os.cpu_count() or 1, len(processor.results))
+
+        if n_workers > 1:
+            print(f"    - Creating per-activity charts with {n_workers} worker processes...")
+            tasks = [
+                (activity_name, results, top_n, processor.proximity_formula)
+                for activity_name, results in processor.results.items()
+            ]
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                initializer=_init_render_worker,
+                initargs=(self.output_dir, self.dpi, self.style, processor.profiles_df)
+            ) as executor:
+                for file_paths in executor.map(_render_activity, tasks):
+                    saved_files.extend(file_paths)
+        else:
+            for i, (activity_name, results) in enumerate(processor.results.items()):
+                print(f"    - Creating charts for activity {i+1}/{len(processor.results)}: {activity_name}")
+                saved_files.extend(self._render_activity_charts(
+                    activity_name, results, processor.profiles_df,
+                    top_n, processor.proximity_formula
+                ))
+
+        self.close_figures()
 
         print(f"\n  Generated {len(saved_files)} visualization files")
 
@@ -43,27 +43,28 @@ def compare_formulas():
 
     results = {}
 
+    # One processor, one distance computation: the normalized matrix,
+    # weights and ideal-solution distances are identical for both formulas,
+    # so only the final coefficient combine runs per formula
+    processor = ProfileProcessor(
+        profiles_df=profiles_df,
+        activities_df=activities_df,
+        threshold=3.0,
+        min_threshold=0.0,
+        max_threshold=5.0
+    )
+    multi_results = processor.process_all_activities_multi_formula(
+        ['standard', 'variant'], weight_strategy="uniform"
+    )
+
     # Test both formulas
     for formula in ['standard', 'variant']:
         print(f"\n{'='*80}")
         print(f"TESTING: {formula.upper()} PROXIMITY FORMULA")
         print(f"{'='*80}")
 
-        # Create processor with specific formula
-        processor = ProfileProcessor(
-            profiles_df=profiles_df,
-            activities_df=activities_df,
-            threshold=3.0,
-            min_threshold=0.0,
-            max_threshold=5.0,
-            proximity_formula=formula
-        )
-
-        # Process all activities
-        processor.process_all_activities(weight_strategy="uniform", verbose=False)
-
         # Get full results matrix
-        full_results_df = processor.get_full_results_matrix()
+        full_results_df = multi_results[formula]['full_results']
 
         # Create optimal assignment solver
         solver = OptimalAssignment(full_results_df)
@@ -131,14 +131,19 @@ def main():
     print(f"{'Activity':<30} {'Hungarian':<20} {'Top-1 Ranking':<20} {'Status':<10}")
     print("-"*80)
 
-    for activity in full_results_df.index:
+    # One argmax over the whole score matrix instead of a per-row
+    # .loc/idxmax pair, which re-runs pandas label indexing per activity
+    vals = full_results_df.to_numpy()
+    top1_idx = vals.argmax(axis=1)
+    top1_profiles = full_results_df.columns.to_numpy()[top1_idx]
+
+    for a, activity in enumerate(full_results_df.index):
         # Hungarian assignment
         hungarian_profile = assignment_results['assignment'][activity]['profile']
         hungarian_score = assignment_results['assignment'][activity]['score']
 
         # Top-1 from ranking
-        top1_profile = full_results_df.loc[activity].idxmax()
-        top1_score = full_results_df.loc[activity].max()
+        top1_profile = top1_profiles[a]
 
         status = "Same" if hungarian_profile == top1_profile else "CHANGED"
 
@@ -7,12 +7,13 @@ Author: Abdel YEZZA (Ph.D)
 
 import sys
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from core.profile_processor import ProfileProcessor, load_profiles_from_csv, load_activities_from_csv
+from src.core.profile_processor import ProfileProcessor, load_profiles_from_csv, load_activities_from_csv
 
 
 def test_threshold_impact():
@@ -33,38 +34,44 @@ def test_threshold_impact():
     test_activity = "Backend_Development"
 
     thresholds = [2.0, 3.0, 4.0]
-    results_summary = {}
+
+    # One processor for all thresholds: the normalized and weighted matrices
+    # do not depend on the threshold, so they are computed once and only the
+    # criteria-type dependent steps re-run per threshold
+    processor = ProfileProcessor(
+        profiles_df=profiles_df,
+        activities_df=activities_df,
+        threshold=thresholds[0],
+        min_threshold=0.0,
+        max_threshold=5.0,
+        proximity_formula='standard'
+    )
+    results_summary = processor.process_activity_for_thresholds(
+        activity_name=test_activity,
+        thresholds=thresholds,
+        weight_strategy='uniform'
+    )
+
+    # Materialize each threshold's ranked results once as a DataFrame so the
+    # report sections below index into it instead of rebuilding transient
+    # lists and dicts from ranked_results
+    for threshold in thresholds:
+        results_summary[threshold]['_ranks_df'] = (
+            pd.DataFrame(results_summary[threshold]['ranked_results'])
+            .set_index('alternative')
+        )
 
     for threshold in thresholds:
         print(f"\n{'='*80}")
         print(f"THRESHOLD = {threshold}")
         print(f"{'='*80}\n")
 
-        # Create processor with this threshold
-        processor = ProfileProcessor(
-            profiles_df=profiles_df,
-            activities_df=activities_df,
-            threshold=threshold,
-            min_threshold=0.0,
-            max_threshold=5.0,
-            proximity_formula='standard'
-        )
-
-        # Process the test activity
-        result = processor.process_activity(
-            activity_name=test_activity,
-            weight_strategy='uniform',
-            verbose=False
-        )
-
-        # Store results
-        results_summary[threshold] = result
+        result = results_summary[threshold]
 
         # Print criteria classification
-        required_skills = activities_df.loc[test_activity].values
-        criteria_types = processor.skill_transformer.determine_criteria_types(required_skills)
-        n_beneficial = sum(criteria_types == 1)
-        n_non_beneficial = sum(criteria_types == 0)
+        criteria_types = np.asarray(result['criteria_types'])
+        n_beneficial = np.count_nonzero(criteria_types == 1)
+        n_non_beneficial = criteria_types.size - n_beneficial
 
         print(f"Criteria Classification:")
         print(f"  Beneficial skills: {n_beneficial} ({n_beneficial/len(criteria_types)*100:.1f}%)")
@@ -75,9 +82,9 @@ def test_threshold_impact():
         print("-" * 60)
         print(f"{'Rank':<6} {'Profile':<15} {'Coefficient':<15} {'Percentage'}")
         print("-" * 60)
-        for i, res in enumerate(result['ranked_results'][:5]):
-            print(f"{res['rank']:<6} {res['alternative']:<15} "
-                  f"{res['coefficient']:<15.6f} {res['percentage']:.2f}%")
+        for res in result['_ranks_df'].head(5).itertuples():
+            print(f"{res.rank:<6} {res.Index:<15} "
+                  f"{res.coefficient:<15.6f} {res.percentage:.2f}%")
 
     # Comparison summary
     print("\n" + "="*80)
@@ -110,41 +117,42 @@ def test_threshold_impact():
 
     print("\nProfiles that appear in Top 5 for ALL thresholds:")
 
-    top5_sets = []
-    for threshold in thresholds:
-        result = results_summary[threshold]
-        top5 = set([r['alternative'] for r in result['ranked_results'][:5]])
-        top5_sets.append(top5)
+    # Ranks as one profiles x thresholds frame: set intersections and
+    # per-profile dict lookups become vectorized column operations
+    ranks_df = pd.DataFrame({
+        t: results_summary[t]['_ranks_df']['rank'] for t in thresholds
+    })
 
-    stable_top5 = top5_sets[0].intersection(*top5_sets[1:])
-    if stable_top5:
+    stable_top5 = ranks_df.index[ranks_df.le(5).all(axis=1)]
+    if len(stable_top5) > 0:
         print("  " + ", ".join(sorted(stable_top5)))
     else:
         print("  None - rankings are highly sensitive to threshold!")
 
     print("\nProfiles that change positions significantly:")
+    # Deltas between consecutive threshold columns, computed in one pass
+    deltas = ranks_df.diff(axis=1)
     for threshold_idx in range(len(thresholds) - 1):
         t1 = thresholds[threshold_idx]
         t2 = thresholds[threshold_idx + 1]
 
-        # Get rankings
-        rank1 = {r['alternative']: r['rank'] for r in results_summary[t1]['ranked_results']}
-        rank2 = {r['alternative']: r['rank'] for r in results_summary[t2]['ranked_results']}
-
         print(f"\n  From threshold {t1} to {t2}:")
 
-        # Find biggest movers
-        changes = []
-        for profile in rank1.keys():
-            change = rank1[profile] - rank2[profile]
-            if abs(change) >= 3:  # Significant change
-                changes.append((profile, rank1[profile], rank2[profile], change))
-
-        if changes:
-            changes.sort(key=lambda x: abs(x[3]), reverse=True)
-            for profile, r1, r2, change in changes[:3]:
-                direction = "UP" if change > 0 else "DOWN"
-                print(f"    {profile}: Rank {r1} -> {r2} ({direction} {abs(change)} positions)")
+        # Top 3 movers with |rank change| >= 3: nlargest selects instead of
+        # fully sorting, and keep='first' breaks ties by the profile's rank
+        # at the lower threshold (the reindex order)
+        mag = deltas[t2].abs()
+        movers = (mag[mag >= 3]
+                  .reindex(ranks_df[t1].sort_values().index)
+                  .dropna()
+                  .nlargest(3, keep='first'))
+
+        if len(movers) > 0:
+            for profile in movers.index:
+                r1 = ranks_df.at[profile, t1]
+                r2 = ranks_df.at[profile, t2]
+                direction = "UP" if r2 < r1 else "DOWN"
+                print(f"    {profile}: Rank {r1} -> {r2} ({direction} {abs(r2 - r1)} positions)")
         else:
             print("    No significant changes (< 3 positions)")
 